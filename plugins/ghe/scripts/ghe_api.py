@@ -0,0 +1,374 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11"
+# dependencies = []
+# ///
+"""
+GHE GitHub API client
+Direct GitHub REST/GraphQL access over a persistent HTTPS connection,
+so repeated calls skip the gh subprocess, its auth lookup and a new TLS
+handshake each time.
+
+Authentication: GH_TOKEN / GITHUB_TOKEN, else `gh auth token` (run once).
+Callers should check ghe_api_available() and fall back to ghe_gh() otherwise.
+"""
+
+import http.client
+import json
+import os
+import re
+import subprocess
+import threading
+import time
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import ghe_common
+
+try:
+    import orjson  # Optional: faster encoding of large bodies
+except ImportError:
+    orjson = None
+
+# Longest time to wait for a rate-limit window to reset before sending anyway
+_MAX_RATE_LIMIT_WAIT = 60.0
+
+# Persistent keep-alive connection per thread (opened on first request);
+# http.client connections must not be shared between threads
+_local = threading.local()
+
+# Methods that are safe to send twice after a connection failure
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+
+# Epoch time before which no request should be sent (rate limit exhausted)
+_rate_limited_until: float = 0.0
+
+# ETag and parsed body of the last 200 response per path (ghe_api_get_cached)
+_etag_cache: Dict[str, Tuple[str, Any]] = {}
+
+
+def debug_log(message: str, level: str = "INFO") -> None:
+    """
+    Append debug message to .claude/hook_debug.log in standard log format.
+    """
+    try:
+        log_file = Path(".claude/hook_debug.log")
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S,%f")[:-3]
+        with open(log_file, "a") as f:
+            f.write(f"{timestamp} {level:<5} [ghe_api] - {message}\n")
+    except Exception:
+        pass
+
+
+def _api_host() -> str:
+    """Get the API host (GitHub Enterprise via GH_HOST)."""
+    host = os.environ.get("GH_HOST", "github.com")
+    return "api.github.com" if host == "github.com" else host
+
+
+def _api_path(path: str) -> str:
+    """Map an API path to the request path for the configured host."""
+    if _api_host() == "api.github.com":
+        return path
+    # GitHub Enterprise Server serves REST under /api/v3 and GraphQL at /api/graphql
+    return "/api/graphql" if path == "/graphql" else f"/api/v3{path}"
+
+
+@lru_cache(maxsize=1)
+def ghe_api_token() -> Optional[str]:
+    """
+    Get a GitHub token from the environment or the gh CLI (cached).
+
+    Returns:
+        Token string, or None if not authenticated
+    """
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token
+
+    try:
+        result = subprocess.run(
+            ["gh", "auth", "token"], capture_output=True, text=True, check=False
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip()
+    except (subprocess.SubprocessError, FileNotFoundError):
+        pass
+
+    debug_log("No GitHub token available", "WARN")
+    return None
+
+
+@lru_cache(maxsize=1)
+def ghe_api_repo() -> Optional[str]:
+    """
+    Get "owner/repo" of the user's repository (cached).
+
+    Uses GH_REPO if set, otherwise the origin remote of GHE_REPO_ROOT.
+
+    Returns:
+        Repository slug, or None if it cannot be determined
+    """
+    slug = os.environ.get("GH_REPO")
+    if slug:
+        return slug
+
+    result = ghe_common.ghe_git("remote", "get-url", "origin", capture=True)
+    if result.returncode == 0:
+        match = re.search(r"[/:]([^/:]+)/([^/]+?)(?:\.git)?/?$", result.stdout.strip())
+        if match:
+            return f"{match.group(1)}/{match.group(2)}"
+
+    debug_log("Could not determine repository owner/name", "WARN")
+    return None
+
+
+def ghe_api_available() -> bool:
+    """
+    Check whether direct API access can be used.
+
+    Returns:
+        True if both a token and the repository slug are known
+    """
+    return ghe_api_token() is not None and ghe_api_repo() is not None
+
+
+def _get_connection() -> http.client.HTTPSConnection:
+    """Return this thread's HTTPS connection, opening it if needed."""
+    connection = getattr(_local, "connection", None)
+    if connection is None:
+        connection = http.client.HTTPSConnection(_api_host(), timeout=30)
+        _local.connection = connection
+    return connection
+
+
+def _reset_connection() -> None:
+    """Close this thread's connection so the next request reconnects."""
+    connection = getattr(_local, "connection", None)
+    if connection is not None:
+        connection.close()
+        _local.connection = None
+
+
+def ghe_api_encode(payload: Any) -> bytes:
+    """
+    Encode a request body to UTF-8 JSON bytes.
+
+    Uses orjson when installed. Non-ASCII text is written as-is rather than
+    escaped, so large bodies stay compact. The result can be passed to
+    ghe_api_request() repeatedly (e.g. on retries) without re-encoding.
+
+    Args:
+        payload: JSON-serializable object
+
+    Returns:
+        Encoded JSON body
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _can_resend(method: str, error: Exception, reused: bool, sent: bool) -> bool:
+    """
+    Decide whether a failed request may be sent again on a new connection.
+
+    GET is idempotent and always may. Any other method is only resent when
+    a kept-alive connection turned out to be closed before the server could
+    act on the request: the send itself failed, or the server hung up
+    without a single response byte. After a timeout or a reset mid-response
+    the write may already have been applied, so it is not repeated.
+    """
+    if method in _IDEMPOTENT_METHODS:
+        return True
+    if not reused:
+        return False
+    if not sent:
+        return isinstance(error, (BrokenPipeError, ConnectionResetError))
+    return isinstance(error, http.client.RemoteDisconnected)
+
+
+def _track_rate_limit(response: http.client.HTTPResponse) -> None:
+    """Record when the rate limit is exhausted so the next call waits."""
+    global _rate_limited_until
+    remaining = response.getheader("X-RateLimit-Remaining")
+    reset = response.getheader("X-RateLimit-Reset")
+    if remaining == "0" and reset and reset.isdigit():
+        _rate_limited_until = float(reset)
+        debug_log(f"Rate limit exhausted until {reset}", "WARN")
+
+
+def _send(
+    method: str,
+    path: str,
+    payload: Optional[Any] = None,
+    extra_headers: Optional[Dict[str, str]] = None,
+) -> Tuple[int, bytes, Optional[http.client.HTTPResponse]]:
+    """
+    Send a request over the persistent connection and read the raw reply.
+
+    Returns:
+        Tuple of (HTTP status, body bytes, response). Status is 0 and the
+        response None if the request could not be sent.
+    """
+    token = ghe_api_token()
+    if token is None:
+        return 0, b"", None
+
+    wait = _rate_limited_until - time.time()
+    if wait > 0:
+        debug_log(f"Waiting {wait:.0f}s for rate limit reset")
+        time.sleep(min(wait, _MAX_RATE_LIMIT_WAIT))
+
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/vnd.github+json",
+        "User-Agent": "ghe-plugin",
+    }
+    if extra_headers:
+        headers.update(extra_headers)
+    body = None
+    if payload is not None:
+        if isinstance(payload, (bytes, bytearray)):
+            body = payload
+        else:
+            body = ghe_api_encode(payload)
+        headers["Content-Type"] = "application/json"
+
+    # Retry once on a fresh connection if the kept-alive one was dropped
+    for attempt in range(2):
+        conn = _get_connection()
+        reused = conn.sock is not None
+        sent = False
+        try:
+            conn.request(method, _api_path(path), body=body, headers=headers)
+            sent = True
+            response = conn.getresponse()
+            data = response.read()
+            break
+        except (http.client.HTTPException, OSError) as e:
+            _reset_connection()
+            if attempt == 1 or not _can_resend(method, e, reused, sent):
+                debug_log(f"{method} {path} failed: {e}", "ERROR")
+                return 0, b"", None
+
+    _track_rate_limit(response)
+    if response.status >= 400:
+        debug_log(f"{method} {path} returned HTTP {response.status}", "WARN")
+    return response.status, data, response
+
+
+def _parse_body(data: bytes) -> Any:
+    """Parse a JSON response body, or None if it is empty or invalid."""
+    try:
+        return json.loads(data) if data else None
+    except json.JSONDecodeError:
+        return None
+
+
+def ghe_api_request(
+    method: str, path: str, payload: Optional[Any] = None
+) -> Tuple[int, Any]:
+    """
+    Send a request to the GitHub API over the persistent connection.
+
+    Safe to call from several threads; each thread keeps its own connection.
+
+    Args:
+        method: HTTP method (GET, POST, PATCH, DELETE, ...)
+        path: API path, e.g. "/repos/owner/repo/issues/1/labels"
+        payload: JSON-serializable request body, or bytes already encoded
+            with ghe_api_encode()
+
+    Returns:
+        Tuple of (HTTP status, parsed JSON body or None).
+        Status is 0 if the request could not be sent.
+    """
+    status, data, _ = _send(method, path, payload)
+    return status, _parse_body(data)
+
+
+def ghe_api_request_with_headers(
+    method: str, path: str, payload: Optional[Any] = None
+) -> Tuple[int, Any, Mapping[str, str]]:
+    """
+    Like ghe_api_request(), but also return the response headers.
+
+    Needed to tell a rate limit (X-RateLimit-Remaining, Retry-After) from
+    other errors that share its status code.
+
+    Returns:
+        Tuple of (HTTP status, parsed JSON body or None, headers). Headers
+        are looked up case-insensitively and are empty if status is 0.
+    """
+    status, data, response = _send(method, path, payload)
+    headers = response.headers if response is not None else {}
+    return status, _parse_body(data), headers
+
+
+def ghe_api_get_cached(path: str) -> Tuple[int, Any]:
+    """
+    GET a resource, revalidating the previous response with its ETag.
+
+    For polling: an unchanged resource is answered with 304 Not Modified,
+    which does not count against the rate limit, and the body from the
+    earlier response is returned instead. Callers must not modify it.
+
+    Args:
+        path: API path, including any query string
+
+    Returns:
+        Tuple of (HTTP status, parsed JSON body or None). A revalidated
+        cached body is returned with status 200.
+    """
+    cached = _etag_cache.get(path)
+    status, data, response = _send(
+        "GET", path, extra_headers={"If-None-Match": cached[0]} if cached else None
+    )
+    if status == 304 and cached is not None:
+        return 200, cached[1]
+
+    body = _parse_body(data)
+    etag = response.getheader("ETag") if response is not None else None
+    if status == 200 and etag:
+        _etag_cache[path] = (etag, body)
+    return status, body
+
+
+def ghe_api_graphql(
+    query: str, variables: Optional[Dict[str, Any]] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Run a GraphQL query or mutation over the persistent connection.
+
+    Args:
+        query: GraphQL document
+        variables: GraphQL variables
+
+    Returns:
+        The response "data" object, or None on any error
+    """
+    status, response = ghe_api_request(
+        "POST", "/graphql", {"query": query, "variables": variables or {}}
+    )
+    if status != 200 or not isinstance(response, dict):
+        return None
+    if response.get("errors"):
+        debug_log(f"GraphQL errors: {response['errors']}", "WARN")
+        return None
+    return response.get("data")
+
+
+__all__ = [
+    "ghe_api_token",
+    "ghe_api_repo",
+    "ghe_api_available",
+    "ghe_api_request",
+    "ghe_api_request_with_headers",
+    "ghe_api_get_cached",
+    "ghe_api_encode",
+    "ghe_api_graphql",
+]
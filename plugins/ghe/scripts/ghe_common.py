@@ -9,11 +9,14 @@ Shared functions for all GHE scripts
 Import this module: from ghe_common import *
 """
 
+import json
 import os
 import re
 import subprocess
 import sys
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Any, Dict
 
@@ -38,6 +41,12 @@ GHE_CURRENT_ISSUE: str = ""
 GHE_CURRENT_PHASE: str = ""
 GHE_AUTO_TRANSCRIBE: str = "false"
 
+# Set once ghe_init() has completed in this process
+_ghe_initialized: bool = False
+
+# Seconds a resolved avatar base URL stays valid in the on-disk cache
+_AVATAR_CACHE_TTL = 3600
+
 # Cached GitHub repo info (populated by ghe_get_github_repo)
 _github_owner: Optional[str] = None
 _github_repo: Optional[str] = None
@@ -86,14 +95,12 @@ def ghe_get_github_repo() -> tuple[Optional[str], Optional[str]]:
             cwd=plugin_repo_root,  # Run from plugin's repo directory
         )
         if result.returncode == 0:
-            import json
-
             data = json.loads(result.stdout)
             _github_owner = data.get("owner", {}).get("login")
             _github_repo = data.get("name")
             if _github_owner and _github_repo:
                 return _github_owner, _github_repo
-    except (subprocess.SubprocessError, json.JSONDecodeError):
+    except (subprocess.SubprocessError, FileNotFoundError, json.JSONDecodeError):
         pass
 
     try:
@@ -112,23 +119,56 @@ def ghe_get_github_repo() -> tuple[Optional[str], Optional[str]]:
                 _github_owner = match.group(1)
                 _github_repo = match.group(2)
                 return _github_owner, _github_repo
-    except subprocess.SubprocessError:
+    except (subprocess.SubprocessError, FileNotFoundError):
         pass
 
     return None, None
 
 
+def _avatar_cache_file() -> Path:
+    """Get the on-disk avatar cache file (shared by all processes of a user)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "ghe" / "avatars.json"
+
+
+@lru_cache(maxsize=1)
 def ghe_get_avatar_base_url() -> str:
     """
     Get the base URL for agent avatars, dynamically using the repo owner/name.
+    Cached: the repo lookup runs at most once per process, even when it fails.
+    A resolved URL is also kept on disk for _AVATAR_CACHE_TTL seconds, so
+    short-lived processes skip the gh/git lookup.
 
     Returns:
         Base URL for avatar images
     """
+    cache_file = _avatar_cache_file()
+    try:
+        cache = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cache = {}
+    if not isinstance(cache, dict):
+        cache = {}
+    entry = cache.get(GHE_PLUGIN_ROOT)
+    if (
+        isinstance(entry, dict)
+        and time.time() - entry.get("fetched_at", 0) < _AVATAR_CACHE_TTL
+    ):
+        return entry["base_url"]
+
     owner, repo = ghe_get_github_repo()
     if owner and repo:
-        return f"https://raw.githubusercontent.com/{owner}/{repo}/main/plugins/ghe/assets/avatars"
-    # Fallback to local relative path
+        base_url = f"https://raw.githubusercontent.com/{owner}/{repo}/main/plugins/ghe/assets/avatars"
+        cache[GHE_PLUGIN_ROOT] = {"base_url": base_url, "fetched_at": time.time()}
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}")
+            tmp_file.write_text(json.dumps(cache), encoding="utf-8")
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            debug_log(f"Could not write avatar cache {cache_file}: {e}", level="WARN")
+        return base_url
+    # Fallback to local relative path (not cached on disk, so it is retried)
     return f"file://{GHE_PLUGIN_ROOT}/assets/avatars"
 
 
@@ -207,8 +247,6 @@ def ghe_validate_issue(issue_num: int) -> Dict[str, Any]:
                 "error": error_msg,
             }
 
-        import json
-
         data = json.loads(result.stdout)
         state = data.get("state", "UNKNOWN")
         title = data.get("title", "")
@@ -264,8 +302,6 @@ def ghe_get_or_create_fallback_issue() -> Optional[int]:
         )
 
         if result.returncode == 0:
-            import json
-
             issues = json.loads(result.stdout)
             if issues:
                 return issues[0]["number"]
@@ -492,6 +528,75 @@ def ghe_gh(*args: str, capture: bool = False) -> subprocess.CompletedProcess:
     )
 
 
+# Values that gh api expands from the repository of the working directory
+_GH_PLACEHOLDERS = ("{owner}", "{repo}", "{branch}")
+
+
+def ghe_gh_graphql(
+    query: str, variables: Optional[Dict[str, Any]] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Run a GraphQL query or mutation for the correct repo
+
+    Uses the persistent HTTPS connection from ghe_api when a token is
+    available, otherwise gh api graphql run from the repo directory.
+    The {owner}/{repo} placeholders are filled in from the repo. With gh,
+    other string variables are sent verbatim (-f), lists as repeated key[]
+    fields, and other types use -F.
+
+    Args:
+        query: GraphQL document
+        variables: GraphQL variables
+
+    Returns:
+        The response "data" object, or None on any error
+    """
+    import ghe_api  # Imported lazily: ghe_api depends on this module
+
+    if ghe_api.ghe_api_available():
+        owner, _, repo = (ghe_api.ghe_api_repo() or "").partition("/")
+        placeholders = {"{owner}": owner, "{repo}": repo}
+        return ghe_api.ghe_api_graphql(
+            query,
+            {
+                key: placeholders.get(value, value) if isinstance(value, str) else value
+                for key, value in (variables or {}).items()
+            },
+        )
+
+    args = ["api", "graphql", "-f", f"query={query}"]
+    for key, value in (variables or {}).items():
+        if isinstance(value, list):
+            # gh builds an array from repeated key[]=value fields
+            for item in value:
+                flag = "-f" if isinstance(item, str) else "-F"
+                args += [flag, f"{key}[]={item}"]
+            if not value:
+                args += ["-f", f"{key}[]"]
+        elif isinstance(value, bool):
+            args += ["-F", f"{key}={str(value).lower()}"]
+        elif isinstance(value, str) and value not in _GH_PLACEHOLDERS:
+            args += ["-f", f"{key}={value}"]
+        else:
+            args += ["-F", f"{key}={value}"]
+
+    result = ghe_gh(*args, capture=True)
+    if result.returncode != 0:
+        debug_log(f"GraphQL request failed: {result.stderr.strip()}", level="WARN")
+        return None
+
+    try:
+        response = json.loads(result.stdout)
+    except json.JSONDecodeError as e:
+        debug_log(f"GraphQL response is not valid JSON: {e}", level="WARN")
+        return None
+
+    if response.get("errors"):
+        debug_log(f"GraphQL errors: {response['errors']}", level="WARN")
+        return None
+    return response.get("data")
+
+
 def ghe_git(*args: str, capture: bool = False) -> subprocess.CompletedProcess:
     """
     Run git commands on the correct repo
@@ -514,13 +619,23 @@ def ghe_git(*args: str, capture: bool = False) -> subprocess.CompletedProcess:
     )
 
 
-def ghe_init() -> None:
+def ghe_init(force: bool = False) -> None:
     """
     Initialize GHE environment variables
     Call this at the start of each script
+
+    Runs once per process: later calls (e.g. an in-process spawn_agent.main()
+    after phase_transition's own init) return immediately.
+
+    Args:
+        force: Re-run initialization even if it already completed
     """
     global GHE_CONFIG_FILE, GHE_REPO_ROOT, GHE_ENABLED
     global GHE_CURRENT_ISSUE, GHE_CURRENT_PHASE, GHE_AUTO_TRANSCRIBE
+    global _ghe_initialized
+
+    if _ghe_initialized and not force:
+        return
 
     debug_log("ghe_init() called")
 
@@ -553,6 +668,7 @@ def ghe_init() -> None:
         os.environ["GHE_CURRENT_PHASE"] = GHE_CURRENT_PHASE
         os.environ["GHE_AUTO_TRANSCRIBE"] = GHE_AUTO_TRANSCRIBE
 
+        _ghe_initialized = True
         debug_log("ghe_init() completed")
     except Exception as e:
         debug_log(f"ghe_init() error: {e}", level="ERROR")
@@ -675,6 +791,7 @@ __all__ = [
     "ghe_get_repo_path",
     "ghe_get_setting",
     "ghe_gh",
+    "ghe_gh_graphql",
     "ghe_git",
     "ghe_init",
     # GitHub functions
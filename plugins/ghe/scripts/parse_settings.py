@@ -11,10 +11,12 @@ Without field-name: outputs all frontmatter
 With field-name: outputs that field's value
 """
 
-import re
+import mmap
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
 # Add script directory to sys.path for ghe_common import
 SCRIPT_DIR = Path(__file__).parent.resolve()
@@ -53,69 +55,105 @@ DEFAULTS = {
 }
 
 
-def extract_frontmatter(content: str) -> str:
+def _frontmatter_lines(content: str) -> Iterator[str]:
     """
-    Extract YAML frontmatter from content (everything between --- markers)
+    Yield the lines between the first and second --- markers
 
     Args:
         content: File content
 
-    Returns:
-        Frontmatter content without delimiters
+    Yields:
+        Frontmatter lines without delimiters
     """
-    # Match everything between first --- and second ---
     # Use sed -n '/^---$/,/^---$/{ /^---$/d; p; }' logic
-    lines = content.split("\n")
     in_frontmatter = False
-    frontmatter_lines = []
 
-    for line in lines:
+    for line in content.split("\n"):
         if line.strip() == "---":
             if in_frontmatter:
                 # Second ---, end of frontmatter
-                break
-            else:
-                # First ---, start of frontmatter
-                in_frontmatter = True
-                continue
+                return
+            # First ---, start of frontmatter
+            in_frontmatter = True
+            continue
         if in_frontmatter:
-            frontmatter_lines.append(line)
+            yield line
 
-    return "\n".join(frontmatter_lines)
 
-
-def extract_field_value(frontmatter: str, field: str) -> str:
+def extract_frontmatter(content: str) -> str:
     """
-    Extract specific field value from frontmatter
+    Extract YAML frontmatter from content (everything between --- markers)
 
     Args:
-        frontmatter: YAML frontmatter content
-        field: Field name to extract
+        content: File content
 
     Returns:
-        Field value or empty string if not found
+        Frontmatter content without delimiters
     """
-    # Match field: value (with optional quotes)
-    pattern = rf"^{re.escape(field)}:\s*(.*)$"
-    match = re.search(pattern, frontmatter, re.MULTILINE)
+    return "\n".join(_frontmatter_lines(content))
+
 
-    if not match:
-        return ""
+def read_frontmatter_region(path: str) -> str:
+    """
+    Read a settings file only up to the end of its frontmatter
 
-    value = match.group(1).strip()
+    The file is memory-mapped and scanned line by line, so the markdown body
+    after the closing --- is never copied into a Python string.
 
-    # Remove surrounding quotes (double or single)
-    if value:
-        # Remove double quotes
-        if value.startswith('"') and value.endswith('"'):
-            value = value[1:-1]
-        # Remove single quotes
-        elif value.startswith("'") and value.endswith("'"):
-            value = value[1:-1]
+    Args:
+        path: Settings file path
 
+    Returns:
+        Decoded file prefix ending with the closing --- line (or the whole
+        file if the frontmatter is not closed)
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap cannot map an empty file
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            lines = []
+            delimiters = 0
+            for line in iter(mm.readline, b""):
+                lines.append(line)
+                if line.strip() == b"---":
+                    delimiters += 1
+                    if delimiters == 2:
+                        break
+    return b"".join(lines).decode("utf-8")
+
+
+def _strip_quotes(value: str) -> str:
+    """Remove one pair of surrounding double or single quotes, if present."""
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
     return value
 
 
+def _add_field(fields: dict[str, str], line: str) -> None:
+    """Record a top-level "field: value" line (first occurrence wins)."""
+    key, sep, value = line.partition(":")
+    if not sep or not key or any(c.isspace() for c in key):
+        return
+    fields.setdefault(key, _strip_quotes(value.strip()))
+
+
+def load_frontmatter(content: str) -> dict[str, str]:
+    """
+    Locate the frontmatter and parse its top-level fields
+
+    Args:
+        content: File content
+
+    Returns:
+        Dict mapping field names to unquoted values (first occurrence wins)
+    """
+    fields: dict[str, str] = {}
+    for line in _frontmatter_lines(content):
+        _add_field(fields, line)
+    return fields
+
+
 def main() -> int:
     """
     Main entry point
@@ -142,12 +180,12 @@ def main() -> int:
         # If no field specified and no config file, output nothing (like bash version)
         return 0
 
-    # Read config file
+    # Read config file (frontmatter region only)
     try:
-        with open(ghe_common.GHE_CONFIG_FILE, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = read_frontmatter_region(ghe_common.GHE_CONFIG_FILE)
         debug_log(
-            f"Read settings file: {ghe_common.GHE_CONFIG_FILE} ({len(content)} bytes)"
+            f"Read settings file: {ghe_common.GHE_CONFIG_FILE} "
+            f"({len(content)} bytes of frontmatter)"
         )
     except (IOError, OSError) as e:
         debug_log(f"Error reading settings file: {e}", "ERROR")
@@ -156,17 +194,15 @@ def main() -> int:
             print(DEFAULTS.get(field_name, ""))
         return 0
 
-    # Extract frontmatter
-    frontmatter = extract_frontmatter(content)
-    debug_log(f"Extracted frontmatter ({len(frontmatter)} chars)")
-
     # If no field specified, output all frontmatter
     if not field_name:
+        frontmatter = extract_frontmatter(content)
+        debug_log(f"Extracted frontmatter ({len(frontmatter)} chars)")
         print(frontmatter)
         return 0
 
-    # Extract specific field value
-    value = extract_field_value(frontmatter, field_name)
+    # Locate and parse the frontmatter in one pass, then look up the field
+    value = load_frontmatter(content).get(field_name, "")
 
     # Return value or default
     if not value:
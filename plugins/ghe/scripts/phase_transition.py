@@ -17,7 +17,7 @@ Usage:
   phase_transition.py <action> <issue-number> [context]
 
 Actions:
-  request <target-phase> - Request transition to target phase
+  request <target-phase> - Request transition to target phase (--fast: execute directly)
   validate <from> <to>   - Validate if transition is allowed
   execute <to>           - Execute transition (update labels, spawn agent)
   demote                 - Demote back to DEV with feedback
@@ -29,25 +29,73 @@ Examples:
   phase_transition.py demote 123 "Test failures" # Send back to DEV
 """
 
-import sys
+import atexit
+import functools
+import logging
 import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 # Import GHE common library
+import ghe_common
 from ghe_common import (
     ghe_init,
     ghe_get_setting,
     ghe_gh,
+    ghe_gh_graphql,
     ghe_git,
-    GHE_REPO_ROOT,
     GHE_RED,
     GHE_GREEN,
     GHE_YELLOW,
     GHE_NC,
     ensure_directory,
 )
+from ghe_api import ghe_api_available, ghe_api_repo, ghe_api_request
+from post_with_avatar import avatar_header
+
+try:
+    import spawn_agent
+except ImportError:  # Fall back to running the script (see spawn_agent_inproc)
+    spawn_agent = None
+
+# Paths that do not change during a run
+_SCRIPT_DIR = Path(__file__).parent
+_SPAWN_SCRIPT = _SCRIPT_DIR / "spawn_agent.py"
+_DEBUG_LOG_FILE = Path(".claude/hook_debug.log")
+
+# Debug logger holding a single persistent handle on .claude/hook_debug.log
+# (created on first use)
+_debug_logger: Optional[logging.Logger] = None
+
+_DEBUG_LEVELS: Dict[str, int] = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARN": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
+
+def _get_debug_logger() -> logging.Logger:
+    """Create the debug logger and its file handler once per process."""
+    global _debug_logger
+    if _debug_logger is None:
+        _DEBUG_LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+        handler = logging.FileHandler(_DEBUG_LOG_FILE, encoding="utf-8")
+        handler.setFormatter(
+            logging.Formatter(
+                "%(asctime)s,%(msecs)03d %(ghe_level)-5s [phase_transition] - %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S",
+            )
+        )
+        logger = logging.getLogger("ghe.phase_transition")
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        logger.addHandler(handler)
+        _debug_logger = logger
+    return _debug_logger
 
 
 def debug_log(message: str, level: str = "INFO") -> None:
@@ -55,15 +103,18 @@ def debug_log(message: str, level: str = "INFO") -> None:
     Append debug message to .claude/hook_debug.log in standard log format.
     """
     try:
-        log_file = Path(".claude/hook_debug.log")
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S,%f")[:-3]
-        with open(log_file, "a") as f:
-            f.write(f"{timestamp} {level:<5} [phase_transition] - {message}\n")
+        _get_debug_logger().log(
+            _DEBUG_LEVELS.get(level, logging.INFO), message, extra={"ghe_level": level}
+        )
     except Exception:
         pass
 
 
+# Settings do not change during a single run; memoize reads of the config file
+# so chained handlers (e.g. demote -> execute) parse it only once
+_get_setting = functools.lru_cache(maxsize=None)(ghe_get_setting)
+
+
 # Valid phases
 PHASES = ["DEV", "TEST", "REVIEW", "MERGE"]
 
@@ -88,6 +139,37 @@ PHASE_LABELS: Dict[str, str] = {
     "REVIEW": "phase:review",
 }
 
+# Label to phase lookup, in precedence order (latest phase wins if several
+# phase labels are present)
+_LABEL_TO_PHASE: Dict[str, str] = {
+    "phase:review": "REVIEW",
+    "phase:test": "TEST",
+    "phase:dev": "DEV",
+}
+
+
+# Allowed (from, to) transitions: forward moves and demotions back to DEV
+_VALID_TRANSITIONS: FrozenSet[Tuple[str, str]] = frozenset(
+    {
+        ("DEV", "TEST"),
+        ("TEST", "REVIEW"),
+        ("REVIEW", "MERGE"),
+        ("REVIEW", "DEV"),
+        ("TEST", "DEV"),
+    }
+)
+_PHASES: FrozenSet[str] = frozenset(PHASES)
+
+# Forward transitions whose phase-gate approval is deterministic, so
+# `request --fast` may validate in-process and skip Themis. MERGE and
+# demotions always go through the phase-gate.
+_FAST_TRANSITIONS: FrozenSet[Tuple[str, str]] = frozenset(
+    {
+        ("DEV", "TEST"),
+        ("TEST", "REVIEW"),
+    }
+)
+
 
 def is_valid_transition(from_phase: str, to_phase: str) -> bool:
     """
@@ -100,21 +182,182 @@ def is_valid_transition(from_phase: str, to_phase: str) -> bool:
     Returns:
         True if transition is valid, False otherwise
     """
-    transition = f"{from_phase}->{to_phase}"
+    # Same phase is a no-op, still valid
+    return (from_phase, to_phase) in _VALID_TRANSITIONS or (
+        from_phase == to_phase and from_phase in _PHASES
+    )
+
+
+# Issue node, current labels and the node IDs of every phase label, in one query
+_ISSUE_QUERY = (
+    "query($owner: String!, $repo: String!, $number: Int!) {"
+    " repository(owner: $owner, name: $repo) {"
+    " issue(number: $number) { id state title labels(first: 100) { nodes { id name } } }"
+    + "".join(
+        f' {phase.lower()}: label(name: "{label}") {{ id }}'
+        for phase, label in PHASE_LABELS.items()
+    )
+    + " } }"
+)
+
+# Per-process cache of issue data fetched by fetch_issue(), keyed by issue number.
+# Entries are dropped by invalidate_issue() after any write to the issue.
+_issue_cache: Dict[str, Dict[str, Any]] = {}
+
+
+def fetch_issue(issue: str) -> Optional[Dict[str, Any]]:
+    """
+    Fetch an issue's node ID, labels, state, title and the phase label IDs
+    in a single GraphQL call (memoized).
+
+    Args:
+        issue: Issue number
+
+    Returns:
+        Issue data with "labels" as a list of {"id", "name"} dicts and
+        "phase_label_ids" mapping phase label names to node IDs,
+        or None if the issue could not be fetched
+    """
+    cached = _issue_cache.get(issue)
+    if cached is not None:
+        debug_log(f"fetch_issue cache hit for issue #{issue}")
+        return cached
+
+    try:
+        number = int(issue)
+    except ValueError:
+        debug_log(f"Invalid issue number: {issue}", "WARN")
+        return None
+
+    data = ghe_gh_graphql(
+        _ISSUE_QUERY, {"owner": "{owner}", "repo": "{repo}", "number": number}
+    )
+    repository = (data or {}).get("repository") or {}
+    issue_data = repository.get("issue")
+    if not issue_data:
+        debug_log(f"Failed to fetch issue #{issue}", "WARN")
+        return None
+
+    issue_data["labels"] = issue_data.get("labels", {}).get("nodes", [])
+    issue_data["phase_label_ids"] = {
+        label: (repository.get(phase.lower()) or {}).get("id")
+        for phase, label in PHASE_LABELS.items()
+    }
+    _issue_cache[issue] = issue_data
+    return issue_data
+
+
+def invalidate_issue(issue: str) -> None:
+    """
+    Drop cached data for an issue after it has been modified.
+
+    Args:
+        issue: Issue number
+    """
+    _issue_cache.pop(issue, None)
+
+
+def apply_transition(
+    issue: str,
+    remove_label: Optional[str],
+    add_label: Optional[str],
+    comment_body: str,
+) -> bool:
+    """
+    Swap phase labels and post the transition comment in one GraphQL mutation.
+
+    The labels are replaced as one complete set, so the swap is atomic.
+
+    Falls back to gh issue edit/comment when node IDs are not available.
+
+    Args:
+        issue: Issue number
+        remove_label: Phase label to remove (None to skip)
+        add_label: Phase label to add (None to skip)
+        comment_body: Comment to post on the issue
+
+    Returns:
+        True if the update was sent successfully
+    """
+    data = fetch_issue(issue) or {}
+    issue_id = data.get("id")
+    label_ids = {label["name"]: label["id"] for label in data.get("labels", [])}
+    label_ids.update(data.get("phase_label_ids", {}))
+    remove_id = label_ids.get(remove_label) if remove_label else None
+    add_id = label_ids.get(add_label) if add_label else None
+
+    invalidate_issue(issue)
+
+    if not issue_id or (remove_label and not remove_id) or (add_label and not add_id):
+        debug_log("Node IDs unavailable, falling back to gh issue edit/comment", "WARN")
+        label_args = []
+        if remove_label:
+            label_args += ["--remove-label", remove_label]
+        if add_label:
+            label_args += ["--add-label", add_label]
+        if label_args:
+            ghe_gh("issue", "edit", issue, *label_args, capture=False)
+        result = ghe_gh(
+            "issue", "comment", issue, "--body", comment_body, capture=False
+        )
+        return result.returncode == 0
+
+    # Set the complete label list in one updateIssue call, so the issue never
+    # has both or neither phase label.
+    fields = []
+    params = ["$issueId: ID!", "$body: String!"]
+    variables: Dict[str, Any] = {"issueId": issue_id, "body": comment_body}
+    if remove_id or add_id:
+        new_label_ids = [
+            label["id"]
+            for label in data.get("labels", [])
+            if label["id"] not in (remove_id, add_id)
+        ]
+        if add_id:
+            new_label_ids.append(add_id)
+        params.append("$labelIds: [ID!]!")
+        variables["labelIds"] = new_label_ids
+        fields.append(
+            "update: updateIssue(input: {id: $issueId, labelIds: $labelIds})"
+            " { clientMutationId }"
+        )
+    fields.append(
+        "comment: addComment(input: {subjectId: $issueId, body: $body})"
+        " { clientMutationId }"
+    )
+    mutation = f"mutation({', '.join(params)}) {{ {' '.join(fields)} }}"
+
+    if ghe_gh_graphql(mutation, variables) is None:
+        debug_log(f"Transition mutation failed for issue #{issue}", "ERROR")
+        return False
+    return True
 
-    # Forward transitions
-    if transition in ["DEV->TEST", "TEST->REVIEW", "REVIEW->MERGE"]:
-        return True
 
-    # Demotions (always go back to DEV)
-    if transition in ["REVIEW->DEV", "TEST->DEV"]:
-        return True
+def _fetch_label_names(issue: str) -> Optional[List[str]]:
+    """
+    Get an issue's label names, reusing fetched issue data when present.
 
-    # Same phase (no-op, still valid)
-    if from_phase == to_phase and from_phase in PHASES:
-        return True
+    On a cache miss the REST labels endpoint is used if the API is available
+    (a smaller response than the full GraphQL issue query), else fetch_issue().
 
-    return False
+    Args:
+        issue: Issue number
+
+    Returns:
+        List of label names, or None if the issue could not be fetched
+    """
+    if issue not in _issue_cache and ghe_api_available():
+        status, labels = ghe_api_request(
+            "GET", f"/repos/{ghe_api_repo()}/issues/{issue}/labels?per_page=100"
+        )
+        if status == 200 and isinstance(labels, list):
+            return [label.get("name", "") for label in labels]
+        debug_log(f"Labels request for issue #{issue} failed (HTTP {status})", "WARN")
+
+    data = fetch_issue(issue)
+    if data is None:
+        return None
+    return [label.get("name", "") for label in data.get("labels", [])]
 
 
 def get_issue_phase(issue: str) -> str:
@@ -128,39 +371,61 @@ def get_issue_phase(issue: str) -> str:
         Current phase ("DEV", "TEST", "REVIEW", or "UNKNOWN")
     """
     debug_log(f"get_issue_phase called for issue #{issue}")
-    result = ghe_gh(
-        "issue",
-        "view",
-        issue,
-        "--json",
-        "labels",
-        "--jq",
-        ".labels[].name",
-        capture=True,
-    )
+    names = _fetch_label_names(issue)
 
-    if result.returncode != 0:
-        debug_log(
-            f"Failed to get labels for issue #{issue}, returncode={result.returncode}",
-            "WARN",
-        )
+    if names is None:
         return "UNKNOWN"
 
-    labels = result.stdout.strip()
-    debug_log(f"Issue #{issue} labels: {labels}")
-
-    if "phase:review" in labels:
-        debug_log(f"Issue #{issue} phase: REVIEW")
-        return "REVIEW"
-    elif "phase:test" in labels:
-        debug_log(f"Issue #{issue} phase: TEST")
-        return "TEST"
-    elif "phase:dev" in labels:
-        debug_log(f"Issue #{issue} phase: DEV")
-        return "DEV"
-    else:
-        debug_log(f"Issue #{issue} phase: UNKNOWN")
-        return "UNKNOWN"
+    debug_log(f"Issue #{issue} labels: {names}")
+
+    # One pass over the labels maps each name straight to its phase (if any);
+    # the table order then picks the most advanced phase present
+    found = {_LABEL_TO_PHASE.get(name) for name in names}
+    for phase in _LABEL_TO_PHASE.values():
+        if phase in found:
+            debug_log(f"Issue #{issue} phase: {phase}")
+            return phase
+
+    debug_log(f"Issue #{issue} phase: UNKNOWN")
+    return "UNKNOWN"
+
+
+# Transition log entries are buffered and written together, flushed every
+# _LOG_FLUSH_EVERY entries, on failure-type statuses, and at exit
+_LOG_FLUSH_EVERY = 8
+_LOG_FLUSH_STATUSES: FrozenSet[str] = frozenset({"REJECTED", "DEMOTED"})
+_log_buffer: List[str] = []
+
+# Transition log line: [timestamp] Issue #N: FROM -> TO [STATUS] message
+_LOG_FMT = "[%s] Issue #%s: %s -> %s [%s] %s\n"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_log_file() -> Path:
+    """
+    Resolve .transitions.log once and create its directory.
+
+    GHE_REPO_ROOT is read from ghe_common on first use, i.e. after ghe_init()
+    has set it, rather than copied at import time when it is still unset.
+    """
+    log_dir = Path(ghe_common.GHE_REPO_ROOT or ".") / "GHE_REPORTS"
+    ensure_directory(str(log_dir))
+    return log_dir / ".transitions.log"
+
+
+def _flush_transition_log() -> None:
+    """Write buffered transition log entries to .transitions.log in one write."""
+    if not _log_buffer:
+        return
+    try:
+        with open(_get_log_file(), "a", encoding="utf-8") as f:
+            f.write("".join(_log_buffer))
+    except (IOError, OSError):
+        pass
+    _log_buffer.clear()
+
+
+atexit.register(_flush_transition_log)
 
 
 def log_transition(
@@ -169,26 +434,21 @@ def log_transition(
     """
     Log transition event to internal log file.
 
+    Entries are buffered; see _flush_transition_log().
+
     Args:
         issue: Issue number
         from_phase: Source phase
         to_phase: Target phase
-        status: Transition status (REQUESTED, EXECUTED, REJECTED, DEMOTED)
+        status: Transition status (REQUESTED, FAST, EXECUTED, REJECTED, DEMOTED)
         message: Additional context
     """
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    repo_root = GHE_REPO_ROOT or "."
-    log_dir = Path(repo_root) / "GHE_REPORTS"
-    ensure_directory(str(log_dir))
-
-    log_file = log_dir / ".transitions.log"
-    log_entry = f"[{timestamp}] Issue #{issue}: {from_phase} -> {to_phase} [{status}] {message}\n"
-
-    try:
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(log_entry)
-    except (IOError, OSError):
-        pass
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+    _log_buffer.append(
+        _LOG_FMT % (timestamp, issue, from_phase, to_phase, status, message)
+    )
+    if len(_log_buffer) >= _LOG_FLUSH_EVERY or status in _LOG_FLUSH_STATUSES:
+        _flush_transition_log()
 
 
 def request_transition(
@@ -208,7 +468,7 @@ def request_transition(
     target_phase = target_phase.upper()
 
     if not issue:
-        issue = ghe_get_setting("current_issue", "")
+        issue = _get_setting("current_issue", "")
         debug_log(f"Using current_issue from settings: {issue}")
 
     if not issue or issue == "null":
@@ -252,17 +512,12 @@ def request_transition(
     # Spawn phase-gate agent for validation
     debug_log(f"Spawning Themis for validation: {current_phase} -> {target_phase}")
     print("Spawning Themis (phase-gate) to validate transition...")
-    script_dir = Path(__file__).parent
-    spawn_script = script_dir / "spawn_agent.py"
-
     context_str = context or ""
     spawn_context = (
         f"Validate: {current_phase} -> {target_phase}. Context: {context_str}"
     )
 
-    subprocess.run(
-        ["python3", str(spawn_script), "phase-gate", issue, spawn_context], check=False
-    )
+    spawn_agent_inproc("phase-gate", issue, spawn_context)
 
     log_transition(
         issue, current_phase, target_phase, "REQUESTED", "Validation pending"
@@ -273,6 +528,20 @@ def request_transition(
     print(f"{GHE_GREEN}Transition request submitted. Themis will validate.{GHE_NC}")
 
 
+def _count_lines(output: str) -> int:
+    """
+    Count lines of command output without splitting it into a list.
+
+    Args:
+        output: Command stdout
+
+    Returns:
+        Number of lines (0 for blank output)
+    """
+    output = output.strip()
+    return output.count("\n") + 1 if output else 0
+
+
 def validate_transition(
     from_phase: str, to_phase: str, issue: Optional[str] = None
 ) -> int:
@@ -294,7 +563,7 @@ def validate_transition(
     to_phase = to_phase.upper()
 
     if not issue:
-        issue = ghe_get_setting("current_issue", "")
+        issue = _get_setting("current_issue", "")
         debug_log(f"Using current_issue from settings: {issue}")
 
     print(f"Validating transition: {from_phase} -> {to_phase} for issue #{issue}")
@@ -314,28 +583,29 @@ def validate_transition(
         # Check that code changes exist
         worktree_path = Path("..") / "ghe-worktrees" / f"issue-{issue}"
         if worktree_path.is_dir():
-            result = ghe_git(
-                "-C", str(worktree_path), "status", "--porcelain", capture=True
-            )
-            changes = (
-                len(result.stdout.strip().split("\n")) if result.stdout.strip() else 0
-            )
-            debug_log(f"Worktree changes detected: {changes}")
-
-            if changes == 0:
-                # Check for commits ahead of main
-                result = ghe_git(
+            # Status and commits-ahead are independent; run both git calls at once
+            worktree = str(worktree_path)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                status_future = executor.submit(
+                    ghe_git, "-C", worktree, "status", "--porcelain", capture=True
+                )
+                log_future = executor.submit(
+                    ghe_git,
                     "-C",
-                    str(worktree_path),
-                    "log",
-                    "--oneline",
+                    worktree,
+                    "rev-list",
+                    "--count",
                     "origin/main..HEAD",
                     capture=True,
                 )
+            changes = _count_lines(status_future.result().stdout)
+            debug_log(f"Worktree changes detected: {changes}")
+
+            if changes == 0:
+                # Check for commits ahead of main
+                result = log_future.result()
                 commits = (
-                    len(result.stdout.strip().split("\n"))
-                    if result.stdout.strip()
-                    else 0
+                    int(result.stdout.strip() or 0) if result.returncode == 0 else 0
                 )
                 debug_log(f"Commits ahead of main: {commits}")
 
@@ -384,26 +654,60 @@ def get_avatar_header(agent_name: str) -> str:
     Returns:
         Avatar header string, or empty string if not available
     """
-    script_dir = Path(__file__).parent
-    avatar_script = script_dir / "post_with_avatar.py"
-
-    if not avatar_script.is_file():
+    try:
+        return avatar_header(agent_name).strip()
+    except Exception as e:
+        debug_log(f"Failed to build avatar header for {agent_name}: {e}", "WARN")
         return ""
 
-    try:
-        # Call the Python script to get avatar header
-        result = subprocess.run(
-            ["python3", str(avatar_script), "--header-only", agent_name],
-            capture_output=True,
-            text=True,
+
+def spawn_agent_inproc(agent_name: str, issue: str, context: str) -> None:
+    """
+    Spawn an agent by calling spawn_agent.main() in this process.
+
+    Avoids starting a second Python interpreter per transition. If the
+    module cannot be imported, runs spawn_agent.py as a subprocess instead.
+    A failed spawn is logged and does not abort the transition.
+
+    Args:
+        agent_name: Agent to spawn (e.g., "phase-gate")
+        issue: Issue number
+        context: Context passed to the agent
+    """
+    if spawn_agent is None:
+        debug_log(f"spawn_agent not importable, running {_SPAWN_SCRIPT}", "WARN")
+        subprocess.run(
+            [sys.executable, str(_SPAWN_SCRIPT), agent_name, issue, context],
             check=False,
         )
-        if result.returncode == 0:
-            return result.stdout.strip()
-    except (subprocess.SubprocessError, FileNotFoundError):
-        pass
+        return
 
-    return ""
+    try:
+        spawn_agent.main([agent_name, issue, context])
+    except SystemExit as e:
+        if e.code:
+            debug_log(f"spawn_agent exited with code {e.code}", "WARN")
+    except Exception as e:
+        debug_log(f"spawn_agent failed: {e}", "ERROR")
+
+
+# Transition comment posted by execute_transition()
+_COMMENT_TEMPLATE = (
+    "{header}\n"
+    "## Phase Transition Complete\n"
+    "\n"
+    "| Field | Value |\n"
+    "|-------|-------|\n"
+    "| **From** | {from_phase} |\n"
+    "| **To** | {to_phase} |\n"
+    "| **Agent** | {greek} |\n"
+    "| **Time** | {ts} |\n"
+    "\n"
+    "**Context**: {ctx}\n"
+    "\n"
+    "---\n"
+    "*Transition executed by Themis (phase-gate)*"
+)
 
 
 def execute_transition(
@@ -423,7 +727,7 @@ def execute_transition(
     target_phase = target_phase.upper()
 
     if not issue:
-        issue = ghe_get_setting("current_issue", "")
+        issue = _get_setting("current_issue", "")
         debug_log(f"Using current_issue from settings: {issue}")
 
     if not issue or issue == "null":
@@ -431,73 +735,136 @@ def execute_transition(
         print(f"{GHE_RED}ERROR: No issue specified{GHE_NC}", file=sys.stderr)
         sys.exit(1)
 
-    current_phase = get_issue_phase(issue)
+    # The avatar header (repo lookup) and the issue fetch are independent
+    # network round-trips: resolve the header in the background meanwhile.
+    # The full issue (with node IDs) is fetched up front, since
+    # apply_transition() needs it and get_issue_phase() then reuses it.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        header_future = executor.submit(get_avatar_header, "Themis")
+        fetch_issue(issue)
+        current_phase = get_issue_phase(issue)
+        header = header_future.result()
     debug_log(f"Current phase for issue #{issue}: {current_phase}")
     print(f"Executing transition: {current_phase} -> {target_phase} for issue #{issue}")
 
-    # Update labels on GitHub
-    debug_log("Updating GitHub labels")
-    print("Updating GitHub labels...")
+    # Same-phase transition is a no-op: skip label updates, spawn and comment
+    if current_phase == target_phase:
+        debug_log(f"No-op transition for issue #{issue}: already in {current_phase}")
+        log_transition(issue, current_phase, target_phase, "EXECUTED", "no-op")
+        print(f"{GHE_YELLOW}Issue #{issue} is already in {current_phase}{GHE_NC}")
+        return
 
-    # Remove current phase label
-    current_label = PHASE_LABELS.get(current_phase)
-    if current_label:
-        debug_log(f"Removing label: {current_label}")
-        ghe_gh("issue", "edit", issue, "--remove-label", current_label, capture=False)
+    target_agent = PHASE_AGENTS.get(target_phase)
+    greek_name = PHASE_GREEK.get(target_phase)
 
-    # Add new phase label
+    # Build the transition comment so it can go out with the label swap
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+
+    comment_body = _COMMENT_TEMPLATE.format_map(
+        {
+            "header": header,
+            "from_phase": current_phase,
+            "to_phase": target_phase,
+            "greek": greek_name or "N/A",
+            "ts": timestamp,
+            "ctx": context or "Workflow progression",
+        }
+    )
+
+    # Update labels and post to issue thread in one request, before the
+    # spawned agent reads them
+    current_label = PHASE_LABELS.get(current_phase)
     new_label = PHASE_LABELS.get(target_phase)
-    if new_label:
-        debug_log(f"Adding label: {new_label}")
-        ghe_gh("issue", "edit", issue, "--add-label", new_label, capture=False)
+    debug_log(
+        f"Updating GitHub labels ({current_label} -> {new_label}) and posting comment"
+    )
+    print("Updating GitHub labels...")
+    apply_transition(issue, current_label, new_label, comment_body)
 
     # Spawn the appropriate agent
-    target_agent = PHASE_AGENTS.get(target_phase)
-    greek_name = PHASE_GREEK.get(target_phase)
-
     if target_agent:
         debug_log(f"Spawning agent: {greek_name} ({target_agent})")
         print(f"Spawning {greek_name} ({target_agent})...")
-        script_dir = Path(__file__).parent
-        spawn_script = script_dir / "spawn_agent.py"
-
         context_str = context or ""
         spawn_context = f"Phase transition from {current_phase}. {context_str}"
 
-        subprocess.run(
-            ["python3", str(spawn_script), target_agent, issue, spawn_context],
-            check=False,
-        )
+        spawn_agent_inproc(target_agent, issue, spawn_context)
+
+    log_transition(
+        issue, current_phase, target_phase, "EXECUTED", f"Agent: {target_agent}"
+    )
+    debug_log(
+        f"Transition complete: {current_phase} -> {target_phase} for issue #{issue}"
+    )
+    print(f"{GHE_GREEN}Transition complete: {current_phase} -> {target_phase}{GHE_NC}")
+
+
+def transition_fast_path(
+    target_phase: str, issue: Optional[str] = None, context: Optional[str] = None
+) -> None:
+    """
+    Request, validate and execute a transition in one process.
+
+    Only for the forward transitions in _FAST_TRANSITIONS, where phase-gate
+    approval is deterministic: reads the issue once, runs
+    validate_transition() in-process instead of spawning Themis, then
+    executes (one label+comment mutation). Any other transition falls back
+    to request_transition() and the phase-gate.
 
-    # Post to issue thread
-    debug_log("Posting transition comment to issue thread")
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    header = get_avatar_header("Themis")
+    Args:
+        target_phase: Target phase to transition to
+        issue: Issue number (optional, uses current_issue if not provided)
+        context: Additional context for the transition
+    """
+    debug_log(
+        f"transition_fast_path called: target={target_phase}, issue={issue}, context={context}"
+    )
+    target_phase = target_phase.upper()
 
-    comment_body = f"""{header}
-## Phase Transition Complete
+    if not issue:
+        issue = _get_setting("current_issue", "")
+        debug_log(f"Using current_issue from settings: {issue}")
 
-| Field | Value |
-|-------|-------|
-| **From** | {current_phase} |
-| **To** | {target_phase} |
-| **Agent** | {greek_name or "N/A"} |
-| **Time** | {timestamp} |
+    if not issue or issue == "null":
+        debug_log("No issue specified and no current issue set", "ERROR")
+        print(
+            f"{GHE_RED}ERROR: No issue specified and no current issue set{GHE_NC}",
+            file=sys.stderr,
+        )
+        sys.exit(1)
 
-**Context**: {context or "Workflow progression"}
+    # One read serves validation and execution (execute_transition reuses it)
+    fetch_issue(issue)
+    current_phase = get_issue_phase(issue)
 
----
-*Transition executed by Themis (phase-gate)*"""
+    if (current_phase, target_phase) not in _FAST_TRANSITIONS:
+        debug_log(
+            f"Fast path not allowed for {current_phase} -> {target_phase}, "
+            "requesting phase-gate validation"
+        )
+        print(
+            f"{GHE_YELLOW}--fast only applies to DEV -> TEST and TEST -> REVIEW; "
+            f"requesting phase-gate validation instead{GHE_NC}"
+        )
+        request_transition(target_phase, issue, context)
+        return
 
-    ghe_gh("issue", "comment", issue, "--body", comment_body, capture=False)
+    if validate_transition(current_phase, target_phase, issue) != 0:
+        log_transition(
+            issue, current_phase, target_phase, "REJECTED", "Fast path validation"
+        )
+        sys.exit(1)
 
+    # Phase-gate is not consulted on this path; record that in the audit trail
+    debug_log(f"Fast path: skipping phase-gate for {current_phase} -> {target_phase}")
     log_transition(
-        issue, current_phase, target_phase, "EXECUTED", f"Agent: {target_agent}"
-    )
-    debug_log(
-        f"Transition complete: {current_phase} -> {target_phase} for issue #{issue}"
+        issue,
+        current_phase,
+        target_phase,
+        "FAST",
+        "Validated in-process, no phase-gate",
     )
-    print(f"{GHE_GREEN}Transition complete: {current_phase} -> {target_phase}{GHE_NC}")
+    execute_transition(target_phase, issue, context)
 
 
 def demote_to_dev(issue: Optional[str] = None, reason: Optional[str] = None) -> None:
@@ -510,7 +877,7 @@ def demote_to_dev(issue: Optional[str] = None, reason: Optional[str] = None) ->
     """
     debug_log(f"demote_to_dev called: issue={issue}, reason={reason}")
     if not issue:
-        issue = ghe_get_setting("current_issue", "")
+        issue = _get_setting("current_issue", "")
         debug_log(f"Using current_issue from settings: {issue}")
 
     if not issue or issue == "null":
@@ -518,7 +885,16 @@ def demote_to_dev(issue: Optional[str] = None, reason: Optional[str] = None) ->
         print(f"{GHE_RED}ERROR: No issue specified{GHE_NC}", file=sys.stderr)
         sys.exit(1)
 
+    # The demotion rewrites labels next: fetch the full issue once for both
+    fetch_issue(issue)
     current_phase = get_issue_phase(issue)
+
+    # Already in DEV: nothing to demote, so no labels, comment or log entry
+    if current_phase == "DEV":
+        debug_log(f"No-op demotion for issue #{issue}: already in DEV")
+        print(f"{GHE_YELLOW}Issue #{issue} is already in DEV{GHE_NC}")
+        return
+
     debug_log(f"Demoting issue #{issue} from {current_phase} to DEV")
     print(f"Demoting issue #{issue} from {current_phase} to DEV")
     print(f"Reason: {reason or 'No reason provided'}")
@@ -540,8 +916,10 @@ def show_usage() -> None:
     print(f"""Usage: {script_name} <action> [args...]
 
 Actions:
-  request <target-phase> [issue] [context]
-      Request transition to target phase (spawns Themis for validation)
+  request <target-phase> [issue] [context] [--fast]
+      Request transition to target phase (spawns Themis for validation).
+      With --fast (DEV -> TEST, TEST -> REVIEW only), validate in-process
+      and execute immediately instead.
 
   validate <from-phase> <to-phase> [issue]
       Validate if transition is allowed (called by phase-gate agent)
@@ -556,6 +934,7 @@ Phases: DEV, TEST, REVIEW, MERGE
 
 Examples:
   {script_name} request TEST 123
+  {script_name} request TEST 123 --fast
   {script_name} validate DEV TEST 123
   {script_name} execute TEST 123 "Unit tests passed"
   {script_name} demote 123 "Test failures in auth module"
@@ -572,6 +951,8 @@ def main() -> None:
 
     # Parse command line arguments
     args = sys.argv[1:]
+    fast = "--fast" in args
+    args = [arg for arg in args if arg != "--fast"]
     action = args[0] if len(args) > 0 else ""
     arg2 = args[1] if len(args) > 1 else None
     arg3 = args[2] if len(args) > 2 else None
@@ -586,8 +967,12 @@ def main() -> None:
             print(f"{GHE_RED}ERROR: Missing target phase{GHE_NC}", file=sys.stderr)
             show_usage()
             sys.exit(1)
-        debug_log(f"Dispatching request_transition: target={arg2}, issue={arg3}")
-        request_transition(arg2, arg3, arg4)
+        if fast:
+            debug_log(f"Dispatching transition_fast_path: target={arg2}, issue={arg3}")
+            transition_fast_path(arg2, arg3, arg4)
+        else:
+            debug_log(f"Dispatching request_transition: target={arg2}, issue={arg3}")
+            request_transition(arg2, arg3, arg4)
 
     elif action == "validate":
         if not arg2 or not arg3:
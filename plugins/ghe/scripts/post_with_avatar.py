@@ -10,7 +10,9 @@ This module provides functions to post GitHub comments with avatar banners.
 Can be used as a library (import functions) or CLI tool.
 
 Usage as library:
+    from ghe_common import ghe_init
     from post_with_avatar import post_issue_comment, format_comment
+    ghe_init()  # Not run on import; call once per process before posting
     post_issue_comment(42, "Claude", "Hello from Claude!")
 
 Usage as CLI:
@@ -18,38 +20,109 @@ Usage as CLI:
     python3 post_with_avatar.py --test
 """
 
-import argparse
+import json
+import os
+import random
+import stat
 import sys
-from datetime import datetime
+import tempfile
+import textwrap
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, List, Mapping, Optional, TextIO, Tuple, Union
 
-# Add script directory to path for imports
-script_dir = Path(__file__).parent
-sys.path.insert(0, str(script_dir))
+# Add script directory to path for imports (once, if not already present)
+_script_dir = Path(__file__).parent.resolve()
+if str(_script_dir) not in sys.path:
+    sys.path.insert(0, str(_script_dir))
 
+# Only what formatting needs is imported up front; the posting functions
+# import ghe_api (http.client, ssl) and ghe_gh when first called
 from ghe_common import (  # noqa: E402
-    ghe_init,
-    ghe_gh,
     ghe_get_avatar_url,
     ghe_get_avatar_base_url,
+    GHE_AGENT_AVATARS,
     GHE_AGENT_NAMES,
 )
 
+# Debug mode - set GHE_DEBUG=1 to write debug messages to .claude/hook_debug.log
+DEBUG_MODE = os.environ.get("GHE_DEBUG", "0") == "1"
+
+# Persistent line-buffered handle on the debug log (opened on first use)
+_debug_file: Optional[TextIO] = None
+
 
 def debug_log(message: str, level: str = "INFO") -> None:
     """
     Append debug message to .claude/hook_debug.log in standard log format.
+    Only active when DEBUG_MODE is enabled.
     """
+    global _debug_file
+    if not DEBUG_MODE:
+        return
+    from datetime import datetime
+
     try:
-        log_file = Path(".claude/hook_debug.log")
-        log_file.parent.mkdir(parents=True, exist_ok=True)
+        if _debug_file is None:
+            log_file = Path(".claude/hook_debug.log")
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            _debug_file = open(log_file, "a", buffering=1)
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S,%f")[:-3]
-        with open(log_file, "a") as f:
-            f.write(f"{timestamp} {level:<5} [post_with_avatar] - {message}\n")
+        _debug_file.write(f"{timestamp} {level:<5} [post_with_avatar] - {message}\n")
     except Exception:
         pass
 
 
+# Bulk posting: concurrent workers, and retries for rate-limited responses
+_BULK_WORKERS = 10
+_BULK_RETRIES = 5
+
+# GitHub rejects comment bodies over 65536 characters; longer content is
+# split into several comments of at most this many characters
+_MAX_COMMENT_CHARS = 60000
+
+# Avatar banner placed above every comment body, as the fixed pieces around
+# the avatar URL and display name (joined by _render)
+_AVATAR_SPACER = "&nbsp;" * 4
+_HEADER_PREFIX = '<p><img src="'
+_HEADER_MID1 = '" width="81" height="81" alt="'
+_HEADER_MID2 = (
+    f'" align="middle">{_AVATAR_SPACER}'
+    '<span style="vertical-align: middle;"><strong>'
+)
+_HEADER_SUFFIX = " said:</strong></span></p>\n\n"
+
+
+def _render(display_name: str, avatar_url: str, content: str = "") -> str:
+    """
+    Render the avatar banner followed by content, in a single join.
+
+    The only renderer: callers pass an already resolved display name and
+    URL, so no lookups happen here.
+    """
+    return "".join(
+        (
+            _HEADER_PREFIX,
+            avatar_url,
+            _HEADER_MID1,
+            display_name,
+            _HEADER_MID2,
+            display_name,
+            _HEADER_SUFFIX,
+            content,
+        )
+    )
+
+
+# Map a "ghe:" agent ID to its display name: _NAME_MAP_GET(name, name).
+# Every key is a "ghe:" ID, so other names come back unchanged without
+# a separate prefix check.
+_NAME_MAP_GET = GHE_AGENT_NAMES.get
+
+
+@lru_cache(maxsize=128)
 def get_github_user_avatar(username: str, size: int = 77) -> str:
     """
     Get GitHub user avatar URL dynamically.
@@ -64,6 +137,7 @@ def get_github_user_avatar(username: str, size: int = 77) -> str:
     return f"https://avatars.githubusercontent.com/{username}?s={size}"
 
 
+@lru_cache(maxsize=128)
 def get_avatar_url(name: str) -> str:
     """
     Get avatar URL for an agent name.
@@ -74,14 +148,10 @@ def get_avatar_url(name: str) -> str:
     Returns:
         URL to the agent's avatar image
     """
-    # If name starts with "ghe:", map to display name
-    if name.startswith("ghe:"):
-        name = GHE_AGENT_NAMES.get(name, name)
-
-    # Use centralized function
-    return ghe_get_avatar_url(name)
+    return ghe_get_avatar_url(_NAME_MAP_GET(name, name))
 
 
+@lru_cache(maxsize=128)
 def get_display_name(agent_id: str) -> str:
     """
     Get display name for an agent.
@@ -92,7 +162,7 @@ def get_display_name(agent_id: str) -> str:
     Returns:
         Human-readable display name
     """
-    return GHE_AGENT_NAMES.get(agent_id, agent_id)
+    return _NAME_MAP_GET(agent_id, agent_id)
 
 
 def get_avatar_header(name: str) -> str:
@@ -121,22 +191,142 @@ def format_comment(name: str, content: str) -> str:
         Formatted markdown with avatar and content
     """
     debug_log(f"format_comment called with name={name}, content_length={len(content)}")
-    # If name starts with "ghe:", map to display name
-    if name.startswith("ghe:"):
-        name = GHE_AGENT_NAMES.get(name, name)
-        debug_log(f"Mapped agent ID to display name: {name}")
+    display_name = _NAME_MAP_GET(name, name)
+    return _render(display_name, get_avatar_url(display_name), content)
+
+
+def _split_content(content: str, limit: int = _MAX_COMMENT_CHARS) -> List[str]:
+    """
+    Split content into chunks of at most limit characters.
+
+    Splits on paragraph boundaries where possible, then on line breaks,
+    and only cuts mid-line for a single line longer than the limit.
+
+    Args:
+        content: Comment body content
+        limit: Maximum characters per chunk
+
+    Returns:
+        List of chunks (just [content] if it already fits)
+    """
+    if len(content) <= limit:
+        return [content]
+
+    chunks: List[str] = []
+    current = ""
+    for paragraph in content.split("\n\n"):
+        while len(paragraph) > limit:
+            cut = paragraph.rfind("\n", 0, limit)
+            if cut <= 0:
+                cut = limit
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(paragraph[:cut])
+            paragraph = paragraph[cut:].lstrip("\n")
+        candidate = f"{current}\n\n{paragraph}" if current else paragraph
+        if len(candidate) > limit:
+            chunks.append(current)
+            candidate = paragraph
+        current = candidate
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _format_chunks(name: str, content: str) -> List[str]:
+    """
+    Format content as one or more comment bodies within GitHub's size limit.
+
+    The first body gets the avatar banner; continuations are marked with
+    <!-- cont N/M -->.
+
+    Args:
+        name: Agent name or agent ID
+        content: Comment body content
+
+    Returns:
+        Comment bodies to post in order
+    """
+    chunks = _split_content(content)
+    if len(chunks) > 1:
+        debug_log(f"Content of {len(content)} chars split into {len(chunks)} comments")
+    total = len(chunks)
+    return [format_comment(name, chunks[0])] + [
+        f"<!-- cont {index}/{total} -->\n{chunk}"
+        for index, chunk in enumerate(chunks[1:], start=2)
+    ]
 
-    avatar_url = get_avatar_url(name)
-    debug_log(f"Using avatar URL: {avatar_url}")
 
-    return f'''<p><img src="{avatar_url}" width="81" height="81" alt="{name}" align="middle">&nbsp;&nbsp;&nbsp;&nbsp;<span style="vertical-align: middle;"><strong>{name} said:</strong></span></p>
+class GhRateLimited(RuntimeError):
+    """GitHub rejected a request because of a (secondary) rate limit."""
 
-{content}'''
+
+class GhServerError(RuntimeError):
+    """GitHub returned a 5xx error."""
+
+
+def _is_rate_limited(status: int, headers: Mapping[str, str]) -> bool:
+    """
+    Check whether a response is a (primary or secondary) rate limit.
+
+    A 403 is only a rate limit when GitHub says so in the headers; without
+    them it is a permission error (no write access, locked issue, ...).
+    """
+    if status == 429:
+        return True
+    return status == 403 and (
+        headers.get("X-RateLimit-Remaining") == "0"
+        or headers.get("Retry-After") is not None
+    )
+
+
+def _api_post_comment(number: int, body: str, retries: int = 0) -> int:
+    """
+    Post a comment via the GitHub REST API over the persistent connection.
+
+    Args:
+        number: Issue or pull request number
+        body: Formatted comment body
+        retries: Times to retry a rate-limited response, backing off
+            exponentially with jitter
+
+    Returns:
+        HTTP status code
+
+    Raises:
+        GhRateLimited: If still rate limited after the retries
+        GhServerError: If GitHub returned a 5xx status
+        RuntimeError: If the request failed or returned another non-2xx status
+            (including a 403 that is not a rate limit)
+    """
+    from ghe_api import ghe_api_encode, ghe_api_repo, ghe_api_request_with_headers
+
+    path = f"/repos/{ghe_api_repo()}/issues/{number}/comments"
+    # Encode once; retries resend the same bytes
+    payload = ghe_api_encode({"body": body})
+    for attempt in range(retries + 1):
+        status, _, headers = ghe_api_request_with_headers("POST", path, payload)
+        rate_limited = _is_rate_limited(status, headers)
+        if not rate_limited or attempt == retries:
+            break
+        delay = 2**attempt + random.random()
+        debug_log(f"Comment to #{number} rate limited, retrying in {delay:.1f}s")
+        time.sleep(delay)
+    if 200 <= status < 300:
+        return status
+    message = f"Posting comment to #{number} failed (HTTP {status})"
+    if rate_limited:
+        raise GhRateLimited(message)
+    if status >= 500:
+        raise GhServerError(message)
+    raise RuntimeError(message)
 
 
 def post_issue_comment(issue_num: int, agent_name: str, content: str) -> None:
     """
     Post a comment to a GitHub issue with avatar banner.
+    Content over GitHub's size limit is posted as several comments.
 
     Args:
         issue_num: Issue number
@@ -144,18 +334,81 @@ def post_issue_comment(issue_num: int, agent_name: str, content: str) -> None:
         content: Comment body content
 
     Raises:
+        RuntimeError: If the GitHub API rejects the comment (GhRateLimited
+            or GhServerError for rate limits and server errors)
         subprocess.CalledProcessError: If gh command fails
     """
+    from ghe_api import ghe_api_available
+    from ghe_common import ghe_gh
+
     debug_log(f"post_issue_comment called: issue={issue_num}, agent={agent_name}")
-    formatted = format_comment(agent_name, content)
-    debug_log(f"Posting comment to issue #{issue_num}")
-    ghe_gh("issue", "comment", str(issue_num), "--body", formatted, capture=True)
+    use_api = ghe_api_available()
+    for formatted in _format_chunks(agent_name, content):
+        debug_log(f"Posting comment to issue #{issue_num}")
+        if use_api:
+            _api_post_comment(issue_num, formatted)
+        else:
+            ghe_gh(
+                "issue", "comment", str(issue_num), "--body", formatted, capture=True
+            ).check_returncode()
     debug_log(f"Successfully posted comment to issue #{issue_num}")
 
 
+def post_issue_comments_bulk(
+    items: List[Tuple[int, str, str]], max_workers: int = _BULK_WORKERS
+) -> List[Tuple[int, Union[int, Exception]]]:
+    """
+    Post many issue comments concurrently.
+
+    Comments are independent, so they are sent from a bounded thread pool
+    (each worker keeps its own keep-alive connection). Rate-limited posts
+    are retried with backoff; other failures are returned, not raised.
+
+    Args:
+        items: (issue number, agent name or ID, content) per comment
+        max_workers: Maximum concurrent posts
+
+    Returns:
+        (issue number, HTTP status or raised exception) per item, in order.
+        The status is 0 when posted through gh (no API token).
+    """
+    from ghe_api import ghe_api_available
+    from ghe_common import ghe_gh
+
+    debug_log(f"post_issue_comments_bulk called with {len(items)} comments")
+    bodies = [
+        (number, _format_chunks(name, content)) for number, name, content in items
+    ]
+    use_api = ghe_api_available()
+
+    def post(number: int, chunks: List[str]) -> int:
+        # Chunks of one oversized comment are posted in order by one worker
+        status = 0
+        for body in chunks:
+            if use_api:
+                status = _api_post_comment(number, body, retries=_BULK_RETRIES)
+            else:
+                ghe_gh(
+                    "issue", "comment", str(number), "--body", body, capture=True
+                ).check_returncode()
+        return status
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(post, number, chunks) for number, chunks in bodies]
+
+    results: List[Tuple[int, Union[int, Exception]]] = []
+    for (number, _), future in zip(bodies, futures):
+        error = future.exception()
+        results.append((number, error if error is not None else future.result()))
+        if error is not None:
+            debug_log(f"Bulk comment to issue #{number} failed: {error}", "ERROR")
+    return results
+
+
 def post_pr_comment(pr_num: int, agent_name: str, content: str) -> None:
     """
     Post a comment to a GitHub PR with avatar banner.
+    Content over GitHub's size limit is posted as several comments.
 
     Args:
         pr_num: Pull request number
@@ -163,18 +416,63 @@ def post_pr_comment(pr_num: int, agent_name: str, content: str) -> None:
         content: Comment body content
 
     Raises:
+        RuntimeError: If the GitHub API rejects the comment (GhRateLimited
+            or GhServerError for rate limits and server errors)
         subprocess.CalledProcessError: If gh command fails
     """
+    from ghe_api import ghe_api_available
+    from ghe_common import ghe_gh
+
     debug_log(f"post_pr_comment called: pr={pr_num}, agent={agent_name}")
-    formatted = format_comment(agent_name, content)
-    debug_log(f"Posting comment to PR #{pr_num}")
-    ghe_gh("pr", "comment", str(pr_num), "--body", formatted, capture=True)
+    use_api = ghe_api_available()
+    for formatted in _format_chunks(agent_name, content):
+        debug_log(f"Posting comment to PR #{pr_num}")
+        if use_api:
+            # PR conversation comments use the issues endpoint
+            _api_post_comment(pr_num, formatted)
+        else:
+            ghe_gh(
+                "pr", "comment", str(pr_num), "--body", formatted, capture=True
+            ).check_returncode()
     debug_log(f"Successfully posted comment to PR #{pr_num}")
 
 
+async def apost_issue_comment(issue_num: int, agent_name: str, content: str) -> None:
+    """
+    Async variant of post_issue_comment().
+
+    Runs the post in a worker thread (with its own keep-alive connection),
+    so many posts can be awaited concurrently, e.g. with asyncio.gather().
+
+    Args:
+        issue_num: Issue number
+        agent_name: Agent name or agent ID
+        content: Comment body content
+    """
+    import asyncio  # Already loaded by the caller's event loop
+
+    await asyncio.to_thread(post_issue_comment, issue_num, agent_name, content)
+
+
+async def apost_pr_comment(pr_num: int, agent_name: str, content: str) -> None:
+    """
+    Async variant of post_pr_comment(); see apost_issue_comment().
+
+    Args:
+        pr_num: Pull request number
+        agent_name: Agent name or agent ID
+        content: Comment body content
+    """
+    import asyncio  # Already loaded by the caller's event loop
+
+    await asyncio.to_thread(post_pr_comment, pr_num, agent_name, content)
+
+
+@lru_cache(maxsize=128)
 def avatar_header(name: str) -> str:
     """
     Generate the avatar header only (without content).
+    Cached per name, since the output only depends on the name.
 
     Args:
         name: Agent name or agent ID
@@ -182,114 +480,292 @@ def avatar_header(name: str) -> str:
     Returns:
         Formatted avatar header markdown
     """
-    # If name starts with "ghe:", map to display name
-    if name.startswith("ghe:"):
-        name = GHE_AGENT_NAMES.get(name, name)
+    display_name = _NAME_MAP_GET(name, name)
+    return _render(display_name, get_avatar_url(display_name))
 
-    avatar_url = get_avatar_url(name)
 
-    return f'''<p><img src="{avatar_url}" width="81" height="81" alt="{name}" align="middle">&nbsp;&nbsp;&nbsp;&nbsp;<span style="vertical-align: middle;"><strong>{name} said:</strong></span></p>
+def run_tests() -> None:
+    """Run basic tests to verify functionality."""
+    # Collect the report and write it once rather than one print per line
+    out = ["Running tests..."]
+    out.append(f"\n0. Avatar base URL (dynamic): {ghe_get_avatar_base_url()}")
+
+    out.append("\n1. Testing get_avatar_url():")
+    out.append(f"   Claude: {get_avatar_url('Claude')}")
+    out.append(f"   ghe:dev-thread-manager: {get_avatar_url('ghe:dev-thread-manager')}")
+    out.append(f"   Unknown agent: {get_avatar_url('NewAgent')}")
+
+    out.append("\n2. Testing get_github_user_avatar():")
+    out.append(f"   User 'octocat': {get_github_user_avatar('octocat')}")
+    out.append(
+        f"   User 'octocat' (size 128): {get_github_user_avatar('octocat', 128)}"
+    )
 
-'''
+    out.append("\n3. Testing get_display_name():")
+    out.append(
+        f"   ghe:dev-thread-manager: {get_display_name('ghe:dev-thread-manager')}"
+    )
+    out.append(f"   Claude: {get_display_name('Claude')}")
 
+    out.append("\n4. Testing format_comment():")
+    comment = format_comment("Claude", "This is a test comment.")
+    out.append(f"   Result:\n{comment}")
 
-def run_tests() -> None:
-    """Run basic tests to verify functionality."""
-    print("Running tests...")
-    print(f"\n0. Avatar base URL (dynamic): {ghe_get_avatar_base_url()}")
+    out.append("\n5. Testing avatar_header():")
+    header = avatar_header("ghe:review-thread-manager")
+    out.append(f"   Result:\n{header}")
 
-    print("\n1. Testing get_avatar_url():")
-    print(f"   Claude: {get_avatar_url('Claude')}")
-    print(f"   ghe:dev-thread-manager: {get_avatar_url('ghe:dev-thread-manager')}")
-    print(f"   Unknown agent: {get_avatar_url('NewAgent')}")
+    out.append("\n6. Available agents:")
+    out.extend(
+        f"   {agent_id} -> {display_name}"
+        for agent_id, display_name in GHE_AGENT_NAMES.items()
+    )
 
-    print("\n2. Testing get_github_user_avatar():")
-    print(f"   User 'octocat': {get_github_user_avatar('octocat')}")
-    print(f"   User 'octocat' (size 128): {get_github_user_avatar('octocat', 128)}")
+    out.append("\nAll tests completed successfully!")
+    sys.stdout.write("\n".join(out) + "\n")
 
-    print("\n3. Testing get_display_name():")
-    print(f"   ghe:dev-thread-manager: {get_display_name('ghe:dev-thread-manager')}")
-    print(f"   Claude: {get_display_name('Claude')}")
 
-    print("\n4. Testing format_comment():")
-    comment = format_comment("Claude", "This is a test comment.")
-    print(f"   Result:\n{comment}")
+# Daemon mode: one long-lived process serves requests from short-lived CLI
+# calls, so Python startup, token lookup and the TLS connection are paid once.
+# Requests are one JSON line {"op": ..., "args": [...]}; only these ops run.
+_DAEMON_OPS = {
+    "avatar_header": avatar_header,
+    "format_comment": format_comment,
+    "post_issue_comment": post_issue_comment,
+    "post_pr_comment": post_pr_comment,
+}
 
-    print("\n5. Testing avatar_header():")
-    header = avatar_header("ghe:review-thread-manager")
-    print(f"   Result:\n{header}")
 
-    print("\n6. Available agents:")
-    for agent_id, display_name in GHE_AGENT_NAMES.items():
-        print(f"   {agent_id} -> {display_name}")
+def _daemon_socket_path() -> str:
+    """
+    Get the daemon socket path.
 
-    print("\nAll tests completed successfully!")
+    $GHE_AVATAR_SOCKET if set, else in $XDG_RUNTIME_DIR (private to the
+    user), else in a per-user 0700 directory under the temp dir.
+    """
+    path = os.environ.get("GHE_AVATAR_SOCKET")
+    if path:
+        return path
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, "ghe-avatar.sock")
+    return os.path.join(
+        tempfile.gettempdir(), f"ghe-avatar-{os.getuid()}", "daemon.sock"
+    )
 
 
-def main() -> None:
-    """Main CLI entry point."""
-    debug_log("main() started")
-    ghe_init()  # Initialize GHE environment
-    debug_log("GHE environment initialized")
+def _owned_socket(path: str) -> bool:
+    """Check that path is a Unix socket owned by the current user."""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid()
+
+
+def serve_daemon(socket_path: Optional[str] = None) -> None:
+    """
+    Serve _DAEMON_OPS requests on a Unix socket until interrupted.
+
+    Requests are handled one at a time on this thread, so they all share
+    ghe_api's (thread-local) keep-alive connection. The socket is only
+    accessible to the current user.
+
+    Args:
+        socket_path: Path of the Unix socket to listen on (default:
+            _daemon_socket_path())
+
+    Raises:
+        RuntimeError: If the socket directory or an existing file at the
+            socket path belongs to someone else
+    """
+    import socketserver
+
+    socket_path = socket_path or _daemon_socket_path()
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            try:
+                request = json.loads(self.rfile.readline())
+                result = _DAEMON_OPS[request["op"]](*request.get("args", []))
+                reply = {"ok": True, "result": result}
+            except Exception as e:
+                debug_log(f"Daemon request failed: {e}", "ERROR")
+                reply = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+
+    socket_dir = os.path.dirname(socket_path) or "."
+    os.makedirs(socket_dir, mode=0o700, exist_ok=True)
+    if os.lstat(socket_dir).st_uid != os.getuid():
+        raise RuntimeError(f"Socket directory {socket_dir} is not owned by this user")
+
+    # Replace a socket left behind by a daemon that did not shut down cleanly,
+    # but never a file someone else put there
+    if os.path.lexists(socket_path):
+        if not _owned_socket(socket_path):
+            raise RuntimeError(f"{socket_path} exists and is not our socket")
+        os.unlink(socket_path)
+
+    # Create the socket as 0600 from the start (no window with wider access)
+    old_umask = os.umask(0o177)
+    try:
+        server = socketserver.UnixStreamServer(socket_path, Handler)
+    finally:
+        os.umask(old_umask)
+    with server:
+        debug_log(f"Daemon listening on {socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(socket_path)
+
+
+def call_via_daemon(op: str, *args: Any) -> Any:
+    """
+    Run an op through the daemon, or directly if no daemon is listening.
+
+    The daemon is only used if its socket belongs to the current user, so
+    another local user cannot intercept the call.
+
+    Args:
+        op: Name of the function to call (a key of _DAEMON_OPS)
+        *args: Positional arguments for it (JSON-serializable)
+
+    Returns:
+        The function's return value
+
+    Raises:
+        RuntimeError: If the daemon reports that the call failed
+    """
+    import socket
+
+    socket_path = _daemon_socket_path()
+    if os.path.lexists(socket_path) and not _owned_socket(socket_path):
+        debug_log(f"Ignoring {socket_path}: not a socket owned by us", "WARN")
+        return _DAEMON_OPS[op](*args)
+
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(socket_path)
+    except (OSError, AttributeError) as e:
+        # No daemon (or no Unix sockets on this platform): nothing was sent yet
+        debug_log(f"Daemon unavailable ({e}), calling {op} directly")
+        return _DAEMON_OPS[op](*args)
+
+    with sock:
+        sock.sendall(json.dumps({"op": op, "args": args}).encode("utf-8") + b"\n")
+        reply = json.loads(sock.makefile("rb").readline())
+
+    if not reply.get("ok"):
+        raise RuntimeError(reply.get("error", "daemon call failed"))
+    return reply.get("result")
+
+
+# Agents section of the CLI help, generated once from the authoritative
+# tables in ghe_common so it cannot drift from them
+_AGENT_ID_WIDTH = max(map(len, GHE_AGENT_NAMES))
+_CLI_EPILOG = "\n".join(
+    [
+        "Available agents:",
+        textwrap.fill(
+            ", ".join(GHE_AGENT_AVATARS),
+            width=60,
+            initial_indent="  ",
+            subsequent_indent="  ",
+            break_on_hyphens=False,
+        ),
+        "",
+        "Agent IDs:",
+        *(
+            f"  {agent_id:{_AGENT_ID_WIDTH}} -> {display_name}"
+            for agent_id, display_name in GHE_AGENT_NAMES.items()
+        ),
+    ]
+)
+
+# CLI help text ({prog} is the script name)
+_HELP = """usage: {prog} [-h] [--test] [--header-only AGENT_NAME] [--daemon]
+       {prog} --via-daemon OP [ARGS ...]
+
+Helper for posting GitHub comments with avatar banners
+
+options:
+  -h, --help            show this help message and exit
+  --test                Run tests to verify functionality
+  --header-only AGENT_NAME
+                        Print avatar header for the given agent and exit
+  --daemon              Serve requests on a Unix socket ($GHE_AVATAR_SOCKET)
+  --via-daemon OP [ARGS ...]
+                        Run OP (avatar_header, format_comment,
+                        post_issue_comment, post_pr_comment) through the
+                        daemon, or directly if none is running
 
-    parser = argparse.ArgumentParser(
-        description="Helper for posting GitHub comments with avatar banners",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
 Examples:
   # Run tests
-  %(prog)s --test
+  {prog} --test
 
   # Get avatar header only
-  %(prog)s --header-only Claude
+  {prog} --header-only Claude
+
+  # Post many comments from shell scripts through one process
+  {prog} --daemon &
+  {prog} --via-daemon post_issue_comment 42 Hera "Review complete"
 
   # Use as Python module
   from post_with_avatar import post_issue_comment
   post_issue_comment(42, "Claude", "Hello!")
 
-Available agents:
-  Claude, Hephaestus, Artemis, Hera, Athena, Themis,
-  Mnemosyne, Ares, Hermes, Chronos, Cerberus, Argos
-
-Agent IDs:
-  ghe:dev-thread-manager       -> Hephaestus
-  ghe:test-thread-manager      -> Artemis
-  ghe:review-thread-manager    -> Hera
-  ghe:github-elements-orchestrator -> Athena
-  ghe:phase-gate               -> Themis
-  ghe:memory-sync              -> Mnemosyne
-  ghe:enforcement              -> Ares
-  ghe:reporter                 -> Hermes
-  ghe:ci-issue-opener          -> Chronos
-  ghe:pr-checker               -> Cerberus
-        """,
-    )
+""" + _CLI_EPILOG
 
-    parser.add_argument(
-        "--test", action="store_true", help="Run tests to verify functionality"
-    )
 
-    parser.add_argument(
-        "--header-only",
-        metavar="AGENT_NAME",
-        help="Print avatar header for the given agent and exit",
-    )
-
-    args = parser.parse_args()
-    debug_log(f"Parsed arguments: header_only={args.header_only}, test={args.test}")
-
-    if args.header_only:
-        debug_log(f"Generating header for agent: {args.header_only}")
-        print(avatar_header(args.header_only))
-        debug_log("Header generation complete")
-    elif args.test:
+def main() -> None:
+    """Main CLI entry point. Expects ghe_init() to have been called."""
+    debug_log("main() started")
+    prog = Path(sys.argv[0]).name
+    args = sys.argv[1:]
+    debug_log(f"Parsed arguments: {args}")
+
+    # Only a few options: dispatch on argv directly rather than via argparse
+    if not args or args[0] in ("-h", "--help"):
+        debug_log("Printing help")
+        print(_HELP.format(prog=prog))
+    elif args[0] == "--test":
         debug_log("Running tests")
         run_tests()
         debug_log("Tests complete")
+    elif args[0] == "--header-only" and len(args) >= 2:
+        debug_log(f"Generating header for agent: {args[1]}")
+        print(avatar_header(args[1]))
+    elif args[0].startswith("--header-only="):
+        name = args[0].partition("=")[2]
+        debug_log(f"Generating header for agent: {name}")
+        print(avatar_header(name))
+    elif args[0] == "--daemon":
+        serve_daemon()
+    elif args[0] == "--via-daemon" and len(args) >= 2 and args[1] in _DAEMON_OPS:
+        try:
+            result = call_via_daemon(args[1], *args[2:])
+        except RuntimeError as e:
+            print(f"{prog}: error: {e}", file=sys.stderr)
+            sys.exit(1)
+        if result is not None:
+            print(result)
     else:
-        debug_log("No arguments provided, printing help")
-        parser.print_help()
+        debug_log(f"Invalid arguments: {args}", "ERROR")
+        print(_HELP.format(prog=prog).partition("\n")[0], file=sys.stderr)
+        print(
+            f"{prog}: error: unrecognized arguments: {' '.join(args)}", file=sys.stderr
+        )
+        sys.exit(2)
 
 
 if __name__ == "__main__":
+    from ghe_common import ghe_init
+
+    # Initialize only when run as a script; importing this module (e.g. from
+    # phase_transition.py for avatar_header) must not re-run ghe_init()
+    ghe_init()  # Initialize GHE environment
+    debug_log("GHE environment initialized")
     main()
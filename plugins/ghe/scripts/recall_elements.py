@@ -15,15 +15,22 @@ Element Types:
 KEY INSIGHT: Only ACTION elements change the project. KNOWLEDGE and JUDGEMENT are discussion.
 """
 
-import argparse
+from __future__ import annotations
+
 import json
 import os
 import re
 import sys
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from operator import itemgetter
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 from pathlib import Path
 
+if TYPE_CHECKING:
+    import argparse
+
 # Import GHE common utilities
 from ghe_common import (
     ghe_init,
@@ -68,65 +75,187 @@ class Colors:
     BOLD = "\033[1m"  # Keep BOLD as it's not in ghe_common
 
 
+# Link patterns used by transform_links()
+_ISSUE_REF_RE = re.compile(r"#(\d+)")
+# Candidate path tokens; a token is a file reference if its extension is known
+_PATH_TOKEN_RE = re.compile(r"[a-zA-Z0-9_/.@-]+")
+_FILE_EXTS = frozenset(
+    {
+        "py",
+        "js",
+        "ts",
+        "md",
+        "yaml",
+        "yml",
+        "json",
+        "sh",
+        "tsx",
+        "jsx",
+        "css",
+        "html",
+        "txt",
+        "conf",
+        "cfg",
+    }
+)
+_REQS_RE = re.compile(r"REQUIREMENTS/([^\s\)]+\.md)")
+_DOCS_RE = re.compile(r"docs/([^\s\)]+\.(md|txt))")
+_LINENUM_RE = re.compile(r":(\d+)")
+# Substrings every file reference contains, to skip the file pass cheaply
+_FILE_EXT_MARKERS = tuple(f".{ext}" for ext in _FILE_EXTS)
+
 # Badge patterns for searching
 PATTERN_KNOWLEDGE = "element-knowledge"
 PATTERN_ACTION = "element-action"
 PATTERN_JUDGEMENT = "element-judgement"
 
 
-def get_pattern(element_type: str) -> str:
-    """Get badge pattern for element type.
+# jq projection applied to `gh issue view --json comments` output
+_COMMENTS_JQ = ".comments | map({createdAt, author: .author.login, body})"
+
+# Borders of the element boxes printed by _print_elements()
+_BOX_TOP = "┌" + "─" * 62 + "┐\n"
+_BOX_MID = "├" + "─" * 62 + "┤\n"
+_BOX_BOTTOM = "└" + "─" * 62 + "┘\n"
+
+# Badge pattern and ANSI color per element type
+_PATTERNS = {
+    "knowledge": PATTERN_KNOWLEDGE,
+    "action": PATTERN_ACTION,
+    "judgement": PATTERN_JUDGEMENT,
+}
+_COLORS = {
+    "knowledge": Colors.BLUE,
+    "action": Colors.GREEN,
+    "judgement": Colors.ORANGE,
+}
+
+
+def run_gh_command(args: List[str]) -> Optional[str]:
+    """Run a gh CLI command and return the output.
 
     Args:
-        element_type: Element type (knowledge, action, or judgement)
+        args: Command arguments to pass to gh
 
     Returns:
-        Badge pattern string
+        Command output as string, or None on failure
     """
-    patterns = {
-        "knowledge": PATTERN_KNOWLEDGE,
-        "action": PATTERN_ACTION,
-        "judgement": PATTERN_JUDGEMENT,
-    }
-    return patterns.get(element_type, "")
+    # Use ghe_gh wrapper from ghe_common - unpack args list
+    result = ghe_gh(*args, capture=True)
+    if result is None or result.returncode != 0:
+        return None
+    stdout: str = result.stdout
+    return stdout
 
 
-def get_color(element_type: str) -> str:
-    """Get ANSI color code for element type.
+def _fetch_comments_api(issue: str) -> Optional[List[Dict[str, Any]]]:
+    """Fetch all comments of an issue from the REST API, 100 per page.
 
     Args:
-        element_type: Element type (knowledge, action, judgement, or other)
+        issue: GitHub issue number
 
     Returns:
-        ANSI color code string
+        List of {createdAt, author, body} dicts, or None on failure
     """
-    colors = {
-        "knowledge": Colors.BLUE,
-        "action": Colors.GREEN,
-        "judgement": Colors.ORANGE,
-    }
-    return colors.get(element_type, Colors.NC)
+    from ghe_api import ghe_api_repo, ghe_api_request
+
+    path = f"/repos/{ghe_api_repo()}/issues/{issue}/comments?per_page=100"
+    comments: List[Dict[str, Any]] = []
+    page = 1
+    while True:
+        status, data = ghe_api_request("GET", f"{path}&page={page}")
+        if status != 200 or not isinstance(data, list):
+            debug_log(f"Comments request for issue #{issue} failed (HTTP {status})")
+            return None
+        comments.extend(
+            {
+                "createdAt": c.get("created_at", ""),
+                "author": (c.get("user") or {}).get("login"),
+                "body": c.get("body") or "",
+            }
+            for c in data
+        )
+        if len(data) < 100:
+            return comments
+        page += 1
 
 
-def run_gh_command(args: List[str]) -> Optional[str]:
-    """Run a gh CLI command and return the output.
+def _fetch_comments(issue: str) -> Optional[List[Dict[str, Any]]]:
+    """Fetch all comments of an issue.
+
+    Uses the REST API over a persistent connection when available, which
+    avoids spawning gh; otherwise a single gh call. Only the fields used
+    here are kept, with the author reduced to its login.
 
     Args:
-        args: Command arguments to pass to gh
+        issue: GitHub issue number
 
     Returns:
-        Command output as string, or None on failure
+        List of {createdAt, author, body} dicts, or None on failure
     """
-    # Use ghe_gh wrapper from ghe_common - unpack args list
-    result = ghe_gh(*args, capture=True)
-    if result is None or result.returncode != 0:
+    from ghe_api import ghe_api_available  # Deferred: loads http.client and ssl
+
+    if ghe_api_available():
+        comments = _fetch_comments_api(issue)
+        if comments is not None:
+            return comments
+
+    output = run_gh_command(
+        [
+            "issue",
+            "view",
+            issue,
+            "--comments",
+            "--json",
+            "comments",
+            "--jq",
+            _COMMENTS_JQ,
+        ]
+    )
+    if not output:
         return None
-    stdout: str = result.stdout
-    return stdout
+    try:
+        comments = json.loads(output)
+    except json.JSONDecodeError:
+        return None
+    return comments if isinstance(comments, list) else None
 
 
+def _body_lower(comment: Dict[str, Any]) -> str:
+    """Get the lowercased body of a comment, computed once per comment.
+
+    Args:
+        comment: Comment object from _fetch_comments()
+
+    Returns:
+        Lowercased body text
+    """
+    body_lower: Optional[str] = comment.get("body_lower")
+    if body_lower is None:
+        body_lower = comment["body"].lower()
+        comment["body_lower"] = body_lower
+    return body_lower
+
+
+def _element_summary(comment: Dict[str, Any], max_lines: int) -> str:
+    """Summarize a comment as date, author and the first lines of its body.
+
+    Args:
+        comment: Comment object from _fetch_comments()
+        max_lines: Number of body lines to keep
+
+    Returns:
+        Multi-line summary text
+    """
+    date = comment["createdAt"].split("T")[0]
+    author = comment["author"]
+    body = "\n".join(comment["body"].split("\n")[:max_lines])
+    return f"Date: {date}\nAuthor: @{author}\n\n{body}"
+
+
+@lru_cache(maxsize=1)
 def get_repo_name() -> str:
-    """Get current repository name in format: owner/repo.
+    """Get current repository name in format: owner/repo (cached).
 
     Returns:
         Repository name or empty string if not in a repo
@@ -137,6 +266,19 @@ def get_repo_name() -> str:
     return output.strip() if output else ""
 
 
+@lru_cache(maxsize=1024)
+def _path_exists(file_path: str) -> bool:
+    """Check whether a referenced file exists (cached per run).
+
+    Args:
+        file_path: Path relative to the current directory
+
+    Returns:
+        True if the path is an existing file
+    """
+    return Path(file_path).is_file()
+
+
 def transform_links(content: str) -> str:
     """Transform GitHub links for better context preservation.
 
@@ -151,6 +293,10 @@ def transform_links(content: str) -> str:
     Returns:
         Transformed content with clickable links
     """
+    # Every link pattern needs a "#" or a "."; plain prose needs no work
+    if "#" not in content and "." not in content:
+        return content
+
     repo = get_repo_name()
 
     if not repo:
@@ -158,42 +304,48 @@ def transform_links(content: str) -> str:
         return content
 
     # Transform issue references (#123 -> full URL)
-    content = re.sub(r"#(\d+)", rf"[#\1](https://github.com/{repo}/issues/\1)", content)
+    if "#" in content:
+        content = _ISSUE_REF_RE.sub(
+            rf"[#\1](https://github.com/{repo}/issues/\1)", content
+        )
 
     # Transform file references (path/to/file.py -> clickable link)
-    file_extensions = r"\.(py|js|ts|md|yaml|yml|json|sh|tsx|jsx|css|html|txt|conf|cfg)"
-    file_pattern = rf"([a-zA-Z0-9_/.@-]+{file_extensions})"
-
     def replace_file_path(match: re.Match[str]) -> str:
         """Replace file path with link if file exists."""
-        file_path = match.group(1)
-        if Path(file_path).is_file():
+        token = match.group(0)
+        file_path = token.rstrip(".")  # Drop a sentence-ending period
+        if file_path.rpartition(".")[2] not in _FILE_EXTS:
+            return token
+        if _path_exists(file_path):
             # Check for line number
-            line_match = re.search(r":(\d+)", content[match.end() : match.end() + 10])
+            end = match.start() + len(file_path)
+            line_match = _LINENUM_RE.search(content[end : end + 10])
             if line_match:
                 line_num = line_match.group(1)
-                return f"[`{file_path}:{line_num}`](https://github.com/{repo}/blob/main/{file_path}#L{line_num})"
+                link = f"[`{file_path}:{line_num}`](https://github.com/{repo}/blob/main/{file_path}#L{line_num})"
             else:
-                return (
+                link = (
                     f"[`{file_path}`](https://github.com/{repo}/blob/main/{file_path})"
                 )
-        return match.group(0)
+            return link + token[len(file_path) :]
+        return token
 
-    content = re.sub(file_pattern, replace_file_path, content)
+    if any(marker in content for marker in _FILE_EXT_MARKERS):
+        content = _PATH_TOKEN_RE.sub(replace_file_path, content)
 
     # Transform REQUIREMENTS/ directory references
-    content = re.sub(
-        r"REQUIREMENTS/([^\s\)]+\.md)",
-        rf"[REQUIREMENTS/\1](https://github.com/{repo}/blob/main/REQUIREMENTS/\1)",
-        content,
-    )
+    if "REQUIREMENTS/" in content:
+        content = _REQS_RE.sub(
+            rf"[REQUIREMENTS/\1](https://github.com/{repo}/blob/main/REQUIREMENTS/\1)",
+            content,
+        )
 
     # Transform docs/ directory references
-    content = re.sub(
-        r"docs/([^\s\)]+\.(md|txt))",
-        rf"[docs/\1](https://github.com/{repo}/blob/main/docs/\1)",
-        content,
-    )
+    if "docs/" in content:
+        content = _DOCS_RE.sub(
+            rf"[docs/\1](https://github.com/{repo}/blob/main/docs/\1)",
+            content,
+        )
 
     return content
 
@@ -216,11 +368,56 @@ def apply_link_transformation(output: str) -> str:
     return output
 
 
-def show_stats(issue: str) -> None:
+def _load_elements(issue: str) -> Optional[List[Dict[str, Any]]]:
+    """Fetch the comments to display, resolving the repository name alongside.
+
+    Link transformation needs get_repo_name(), a second gh round-trip, so it
+    runs in a worker thread while the comments are fetched.
+
+    Args:
+        issue: GitHub issue number
+
+    Returns:
+        List of comments, or None on failure
+    """
+    if os.environ.get("TRANSFORM_LINKS", "true").lower() != "true":
+        return _fetch_comments(issue)
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        repo_future = executor.submit(get_repo_name)
+        comments = _fetch_comments(issue)
+        repo_future.result()
+    return comments
+
+
+def _render_bar(label: str, color: str, count: int, pct: int, width: int = 20) -> str:
+    """Render one line of the element distribution chart.
+
+    Args:
+        label: Element type label
+        color: ANSI color code for the label and the filled part of the bar
+        count: Number of elements of this type
+        pct: Percentage of all comments (0-100)
+        width: Bar width in characters
+
+    Returns:
+        Colored bar line, ending with a newline
+    """
+    filled = pct * width // 100
+    return (
+        f"  {color}{label}{Colors.NC}{' ' * (11 - len(label))}{count:<3} "
+        f"{color}{'█' * filled}{Colors.NC}{'░' * (width - filled)} {pct}%\n"
+    )
+
+
+def show_stats(issue: str, comments: Optional[List[Dict[str, Any]]] = None) -> None:
     """Show element distribution statistics for an issue.
 
     Args:
         issue: GitHub issue number
+        comments: Comments already fetched with _fetch_comments(), if any
     """
     print(
         f"{Colors.BOLD}{Colors.CYAN}GitHub Elements Statistics: Issue #{issue}{Colors.NC}"
@@ -228,34 +425,23 @@ def show_stats(issue: str) -> None:
     print(f"{Colors.CYAN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{Colors.NC}")
     print()
 
-    # Get statistics using jq
-    jq_query = """
-        {
-            total: .comments | length,
-            knowledge: [.comments[] | select(.body | contains("element-knowledge"))] | length,
-            action: [.comments[] | select(.body | contains("element-action"))] | length,
-            judgement: [.comments[] | select(.body | contains("element-judgement"))] | length,
-            compound: [.comments[] | select(
-                ((.body | contains("element-knowledge")) and (.body | contains("element-action"))) or
-                ((.body | contains("element-knowledge")) and (.body | contains("element-judgement"))) or
-                ((.body | contains("element-action")) and (.body | contains("element-judgement")))
-            )] | length
-        }
-    """
-
-    output = run_gh_command(
-        ["issue", "view", issue, "--comments", "--json", "comments", "--jq", jq_query]
-    )
-
-    if not output:
+    if comments is None:
+        comments = _fetch_comments(issue)
+    if comments is None:
         return
 
-    stats = json.loads(output)
-    total = stats["total"]
-    knowledge = stats["knowledge"]
-    action = stats["action"]
-    judgement = stats["judgement"]
-    compound = stats["compound"]
+    # Count every badge in a single pass over the comments
+    total = len(comments)
+    knowledge = action = judgement = compound = 0
+    for comment in comments:
+        body = comment["body"]
+        has_k = PATTERN_KNOWLEDGE in body
+        has_a = PATTERN_ACTION in body
+        has_j = PATTERN_JUDGEMENT in body
+        knowledge += has_k
+        action += has_a
+        judgement += has_j
+        compound += has_k + has_a + has_j >= 2
 
     # Calculate percentages
     k_pct = (knowledge * 100 // total) if total > 0 else 0
@@ -266,20 +452,11 @@ def show_stats(issue: str) -> None:
     print(f"{Colors.BOLD}Element Distribution:{Colors.NC}")
     print()
 
-    # Knowledge bar
-    print(f"  {Colors.BLUE}KNOWLEDGE{Colors.NC}  {knowledge:<3} ", end="")
-    print(f"{Colors.BLUE}{'█' * (k_pct // 5)}{Colors.NC}", end="")
-    print(f"{'░' * (20 - k_pct // 5)} {k_pct}%")
-
-    # Action bar
-    print(f"  {Colors.GREEN}ACTION{Colors.NC}     {action:<3} ", end="")
-    print(f"{Colors.GREEN}{'█' * (a_pct // 5)}{Colors.NC}", end="")
-    print(f"{'░' * (20 - a_pct // 5)} {a_pct}%")
-
-    # Judgement bar
-    print(f"  {Colors.ORANGE}JUDGEMENT{Colors.NC}  {judgement:<3} ", end="")
-    print(f"{Colors.ORANGE}{'█' * (j_pct // 5)}{Colors.NC}", end="")
-    print(f"{'░' * (20 - j_pct // 5)} {j_pct}%")
+    sys.stdout.write(
+        _render_bar("KNOWLEDGE", Colors.BLUE, knowledge, k_pct)
+        + _render_bar("ACTION", Colors.GREEN, action, a_pct)
+        + _render_bar("JUDGEMENT", Colors.ORANGE, judgement, j_pct)
+    )
 
     print()
     print(f"{Colors.BOLD}Summary:{Colors.NC}")
@@ -288,6 +465,28 @@ def show_stats(issue: str) -> None:
     print()
 
 
+def _print_elements(elements: List[Dict[str, Any]]) -> None:
+    """Print elements as boxes showing date, author and the start of the body.
+
+    Args:
+        elements: Comments to display, in display order
+    """
+    parts: List[str] = []
+    for element in elements:
+        date = element["createdAt"].split("T")[0]
+
+        # Box with the first 15 lines of the body, then a blank line
+        parts.append(_BOX_TOP)
+        parts.append(f"│ {date} │ @{element['author']}\n")
+        parts.append(_BOX_MID)
+        parts.extend(f"│ {line}\n" for line in element["body"].split("\n", 15)[:15])
+        parts.append(_BOX_BOTTOM)
+        parts.append("\n")
+
+    # Transform links once over the whole listing and write it in one go
+    sys.stdout.write(apply_link_transformation("".join(parts)))
+
+
 def query_by_type(
     issue: str, element_type: str, last_n: int = 0, search_pattern: str = ""
 ) -> None:
@@ -299,8 +498,8 @@ def query_by_type(
         last_n: Return only the last N elements (0 = all)
         search_pattern: Filter elements containing this pattern (case-insensitive)
     """
-    pattern = get_pattern(element_type)
-    color = get_color(element_type)
+    pattern = _PATTERNS.get(element_type, "")
+    color = _COLORS.get(element_type, Colors.NC)
 
     print(
         f"{Colors.BOLD}{color}Recalling {element_type.upper()} elements from Issue #{issue}{Colors.NC}"
@@ -308,71 +507,24 @@ def query_by_type(
     print(f"{color}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{Colors.NC}")
     print()
 
-    # Build jq filter
+    # Filter, sort and limit in Python over a single fetch
+    comments = _load_elements(issue) or []
+    elements = [c for c in comments if pattern in c["body"]]
     if search_pattern:
         # Case-insensitive search within element type
-        jq_filter = f'''
-            [.comments[] | select(.body | contains("{pattern}")) |
-             select(.body | ascii_downcase | contains("{search_pattern.lower()}"))]
-        '''
-    else:
-        jq_filter = f'[.comments[] | select(.body | contains("{pattern}"))]'
-
-    # Add sorting
-    jq_filter += " | sort_by(.createdAt)"
-
-    # Add limiting
+        needle = search_pattern.lower()
+        elements = [c for c in elements if needle in _body_lower(c)]
+    elements.sort(key=itemgetter("createdAt"))
     if last_n > 0:
-        jq_filter += f" | .[-{last_n}:]"
-
-    # Format output
-    jq_filter += " | .[] | {date: .createdAt, author: .author.login, body: .body}"
-
-    # Execute query
-    output = run_gh_command(
-        ["issue", "view", issue, "--comments", "--json", "comments", "--jq", jq_filter]
-    )
+        elements = elements[-last_n:]
 
-    if not output or output.strip() == "":
+    if not elements:
         print(f"{Colors.YELLOW}No {element_type} elements found{Colors.NC}")
         if search_pattern:
             print(f'{Colors.YELLOW}(searched for: "{search_pattern}"){Colors.NC}')
         return
 
-    # Parse and display results
-    for line in output.strip().split("\n"):
-        if not line.strip():
-            continue
-
-        try:
-            element = json.loads(line)
-            date = element["date"].split("T")[0]
-            author = element["author"]
-            body = element["body"]
-
-            # Format output with box drawing
-            formatted = (
-                "┌──────────────────────────────────────────────────────────────┐\n"
-            )
-            formatted += f"│ {date} │ @{author}\n"
-            formatted += (
-                "├──────────────────────────────────────────────────────────────┤\n"
-            )
-
-            # Show first 15 lines of body
-            body_lines = body.split("\n")[:15]
-            for body_line in body_lines:
-                formatted += f"│ {body_line}\n"
-
-            formatted += (
-                "└──────────────────────────────────────────────────────────────┘\n"
-            )
-
-            # Apply link transformation and print
-            print(apply_link_transformation(formatted))
-
-        except json.JSONDecodeError:
-            continue
+    _print_elements(elements)
 
 
 def query_compound(issue: str, types: str, last_n: int = 0) -> None:
@@ -389,76 +541,24 @@ def query_compound(issue: str, types: str, last_n: int = 0) -> None:
     print(f"{Colors.CYAN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{Colors.NC}")
     print()
 
-    # Parse compound type and build conditions
-    conditions = []
-
-    if "knowledge" in types:
-        conditions.append(f'(.body | contains("{PATTERN_KNOWLEDGE}"))')
-
-    if "action" in types:
-        conditions.append(f'(.body | contains("{PATTERN_ACTION}"))')
-
-    if "judgement" in types:
-        conditions.append(f'(.body | contains("{PATTERN_JUDGEMENT}"))')
+    # Parse compound type into the badges an element must carry
+    patterns = tuple(p for name, p in _PATTERNS.items() if name in types)
 
-    if not conditions:
+    if not patterns:
         print(f"{Colors.RED}Error: Invalid compound type{Colors.NC}", file=sys.stderr)
         return
 
-    # Join conditions with 'and'
-    condition_str = " and ".join(conditions)
-
-    # Build jq filter
-    jq_filter = f"[.comments[] | select({condition_str})] | sort_by(.createdAt)"
-
+    comments = _load_elements(issue) or []
+    elements = [c for c in comments if all(p in c["body"] for p in patterns)]
+    elements.sort(key=itemgetter("createdAt"))
     if last_n > 0:
-        jq_filter += f" | .[-{last_n}:]"
+        elements = elements[-last_n:]
 
-    jq_filter += " | .[] | {date: .createdAt, author: .author.login, body: .body}"
-
-    # Execute query
-    output = run_gh_command(
-        ["issue", "view", issue, "--comments", "--json", "comments", "--jq", jq_filter]
-    )
-
-    if not output or output.strip() == "":
+    if not elements:
         print(f"{Colors.YELLOW}No compound elements found matching: {types}{Colors.NC}")
         return
 
-    # Parse and display results
-    for line in output.strip().split("\n"):
-        if not line.strip():
-            continue
-
-        try:
-            element = json.loads(line)
-            date = element["date"].split("T")[0]
-            author = element["author"]
-            body = element["body"]
-
-            # Format output with box drawing
-            formatted = (
-                "┌──────────────────────────────────────────────────────────────┐\n"
-            )
-            formatted += f"│ {date} │ @{author}\n"
-            formatted += (
-                "├──────────────────────────────────────────────────────────────┤\n"
-            )
-
-            # Show first 15 lines of body
-            body_lines = body.split("\n")[:15]
-            for body_line in body_lines:
-                formatted += f"│ {body_line}\n"
-
-            formatted += (
-                "└──────────────────────────────────────────────────────────────┘\n"
-            )
-
-            # Apply link transformation and print
-            print(apply_link_transformation(formatted))
-
-        except json.JSONDecodeError:
-            continue
+    _print_elements(elements)
 
 
 def smart_recover(issue: str) -> None:
@@ -485,8 +585,24 @@ def smart_recover(issue: str) -> None:
     )
     print()
 
+    # Fetch the comments once; every section below is computed from them
+    comments = _load_elements(issue)
+
     # 1. Show statistics first
-    show_stats(issue)
+    show_stats(issue, comments)
+
+    comments = comments or []
+    knowledge: List[Dict[str, Any]] = []
+    actions: List[Dict[str, Any]] = []
+    judgements: List[Dict[str, Any]] = []
+    for comment in comments:
+        body = comment["body"]
+        if PATTERN_KNOWLEDGE in body:
+            knowledge.append(comment)
+        if PATTERN_ACTION in body:
+            actions.append(comment)
+        if PATTERN_JUDGEMENT in body:
+            judgements.append(comment)
 
     # 2. Get first KNOWLEDGE (original context)
     print(
@@ -494,23 +610,8 @@ def smart_recover(issue: str) -> None:
     )
     print()
 
-    jq_query = """
-        [.comments[] | select(.body | contains("element-knowledge"))] |
-        first |
-        if . then
-            "Date: \\(.createdAt | split("T")[0])\\nAuthor: @\\(.author.login)\\n\\n\\(.body | split("\\n")[0:20] | join("\\n"))"
-        else
-            "No knowledge elements found"
-        end
-    """
-
-    output = run_gh_command(
-        ["issue", "view", issue, "--comments", "--json", "comments", "--jq", jq_query]
-    )
-
-    if output and output.strip() and output.strip() != "null":
-        first_knowledge = output.strip().strip('"').replace("\\n", "\n")
-        first_knowledge = apply_link_transformation(first_knowledge)
+    if knowledge:
+        first_knowledge = apply_link_transformation(_element_summary(knowledge[0], 20))
         print(f"{Colors.BLUE}{first_knowledge}{Colors.NC}")
     else:
         print(f"{Colors.YELLOW}No knowledge elements found{Colors.NC}")
@@ -523,23 +624,8 @@ def smart_recover(issue: str) -> None:
     )
     print()
 
-    jq_query = """
-        [.comments[] | select(.body | contains("element-action"))] |
-        last |
-        if . then
-            "Date: \\(.createdAt | split("T")[0])\\nAuthor: @\\(.author.login)\\n\\n\\(.body | split("\\n")[0:25] | join("\\n"))"
-        else
-            "No action elements found"
-        end
-    """
-
-    output = run_gh_command(
-        ["issue", "view", issue, "--comments", "--json", "comments", "--jq", jq_query]
-    )
-
-    if output and output.strip() and output.strip() != "null":
-        last_action = output.strip().strip('"').replace("\\n", "\n")
-        last_action = apply_link_transformation(last_action)
+    if actions:
+        last_action = apply_link_transformation(_element_summary(actions[-1], 25))
         print(f"{Colors.GREEN}{last_action}{Colors.NC}")
     else:
         print(f"{Colors.YELLOW}No action elements found{Colors.NC}")
@@ -552,20 +638,15 @@ def smart_recover(issue: str) -> None:
     )
     print()
 
-    jq_query = """
-        [.comments[] | select(.body | contains("element-judgement"))] |
-        .[-3:] |
-        .[] |
-        "┌─ \\(.createdAt | split("T")[0]) │ @\\(.author.login)\\n\\(.body | split("\\n")[0:10] | .[] | "│ \\(.)")\\n└─────────────────────────────────"
-    """
-
-    output = run_gh_command(
-        ["issue", "view", issue, "--comments", "--json", "comments", "--jq", jq_query]
-    )
-
-    if output and output.strip():
-        recent_judgements = output.strip().strip('"').replace("\\n", "\n")
-        recent_judgements = apply_link_transformation(recent_judgements)
+    if judgements:
+        boxes = []
+        for comment in judgements[-3:]:
+            date = comment["createdAt"].split("T")[0]
+            lines = [f"┌─ {date} │ @{comment['author']}"]
+            lines.extend(f"│ {line}" for line in comment["body"].split("\n")[:10])
+            lines.append("└─────────────────────────────────")
+            boxes.append("\n".join(lines))
+        recent_judgements = apply_link_transformation("\n".join(boxes))
         print(f"{Colors.ORANGE}{recent_judgements}{Colors.NC}")
     else:
         print(f"{Colors.YELLOW}No judgement elements found{Colors.NC}")
@@ -576,52 +657,9 @@ def smart_recover(issue: str) -> None:
     print(f"{Colors.BOLD}{Colors.CYAN}═══ RECOMMENDED NEXT ACTION ═══{Colors.NC}")
     print()
 
-    # Get counts for analysis
-    action_count_output = run_gh_command(
-        [
-            "issue",
-            "view",
-            issue,
-            "--comments",
-            "--json",
-            "comments",
-            "--jq",
-            '[.comments[] | select(.body | contains("element-action"))] | length',
-        ]
-    )
-    action_count = int(action_count_output.strip()) if action_count_output else 0
-
-    knowledge_count_output = run_gh_command(
-        [
-            "issue",
-            "view",
-            issue,
-            "--comments",
-            "--json",
-            "comments",
-            "--jq",
-            '[.comments[] | select(.body | contains("element-knowledge"))] | length',
-        ]
-    )
-    knowledge_count = (
-        int(knowledge_count_output.strip()) if knowledge_count_output else 0
-    )
-
-    judgement_count_output = run_gh_command(
-        [
-            "issue",
-            "view",
-            issue,
-            "--comments",
-            "--json",
-            "comments",
-            "--jq",
-            '[.comments[] | select(.body | contains("element-judgement"))] | length',
-        ]
-    )
-    judgement_count = (
-        int(judgement_count_output.strip()) if judgement_count_output else 0
-    )
+    action_count = len(actions)
+    knowledge_count = len(knowledge)
+    judgement_count = len(judgements)
 
     # Provide recommendations
     if judgement_count > 0:
@@ -654,9 +692,14 @@ def smart_recover(issue: str) -> None:
 def create_parser() -> argparse.ArgumentParser:
     """Create argument parser with all options.
 
+    argparse is imported here, as it is only needed for --help and for
+    invocations _parse_args_fast() does not handle.
+
     Returns:
         Configured ArgumentParser instance
     """
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Element-based memory recall from GitHub Issues",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -748,7 +791,66 @@ RECALL DECISION GUIDE:
     return parser
 
 
-def validate_args(args: argparse.Namespace) -> None:
+# Options understood by _parse_args_fast(), mapped to their attribute names
+_FAST_FLAGS = {"--stats": "stats", "--recover": "recover"}
+_FAST_OPTIONS = {
+    "--issue": "issue",
+    "--type": "type",
+    "--last": "last",
+    "--search": "search",
+    "--compound": "compound",
+}
+
+
+def _parse_args_fast(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Parse the common invocations without importing argparse.
+
+    Anything unusual (help, abbreviated or unknown options, values that
+    look like options, bad values) returns None, so that create_parser()
+    handles it and reports errors exactly as before.
+
+    Args:
+        argv: Command-line arguments, without the program name
+
+    Returns:
+        Parsed arguments with the same attributes as argparse, or None
+    """
+    values: Dict[str, Any] = {
+        "issue": None,
+        "type": None,
+        "last": 0,
+        "search": "",
+        "stats": False,
+        "recover": False,
+        "compound": None,
+    }
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+        if arg in _FAST_FLAGS:
+            values[_FAST_FLAGS[arg]] = True
+            continue
+        name, eq, value = arg.partition("=")
+        if name not in _FAST_OPTIONS:
+            return None
+        if not eq:
+            if i >= len(argv) or argv[i].startswith("-"):
+                return None
+            value = argv[i]
+            i += 1
+        values[_FAST_OPTIONS[name]] = value
+
+    if values["issue"] is None or values["type"] not in (None, *_PATTERNS):
+        return None
+    try:
+        values["last"] = int(values["last"])
+    except ValueError:
+        return None
+    return SimpleNamespace(**values)
+
+
+def validate_args(args: Union[argparse.Namespace, SimpleNamespace]) -> None:
     """Validate parsed arguments.
 
     Args:
@@ -782,8 +884,7 @@ def main() -> None:
     # Initialize GHE environment
     ghe_init()
 
-    parser = create_parser()
-    args = parser.parse_args()
+    args = _parse_args_fast(sys.argv[1:]) or create_parser().parse_args()
 
     debug_log(
         f"Args: issue={args.issue}, recover={args.recover}, type={args.type}, stats={args.stats}, compound={args.compound}"
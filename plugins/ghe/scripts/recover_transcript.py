@@ -15,14 +15,32 @@ We extract all assistant messages and add them to the WAL.
 
 from __future__ import annotations
 
-import hashlib
 import json
 import os
+import re
 import subprocess
 import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+try:
+    from orjson import loads as _json_loads  # Optional: faster JSONL parsing
+except ImportError:
+    _json_loads = json.loads
+
+# current_issue setting in ghe.local.md
+_ISSUE_RE = re.compile(rb'^current_issue:\s*["\']?(\d+)["\']?', re.MULTILINE)
+
+# WAL hash field as written by json.dumps (default, then compact separators)
+_WAL_HASH_KEYS = (b'"hash": "', b'"hash":"')
+
+# Role fields of the messages worth parsing (compact, then json.dumps spacing)
+_ROLE_MARKERS = (
+    b'"role":"user"', b'"role":"assistant"',
+    b'"role": "user"', b'"role": "assistant"',
+)
 
 # Add scripts directory to path for imports
 _script_dir = Path(__file__).parent.resolve()
@@ -30,40 +48,83 @@ if str(_script_dir) not in sys.path:
     sys.path.insert(0, str(_script_dir))
 
 
+# Persistent line-buffered handle on the debug log (opened on first use)
+_debug_file: Optional[TextIO] = None
+
+
 def debug_log(message: str, level: str = "INFO") -> None:
     """Append debug message to hook_debug.log."""
+    global _debug_file
     try:
-        log_file = Path(".claude/hook_debug.log")
-        log_file.parent.mkdir(parents=True, exist_ok=True)
+        if _debug_file is None:
+            log_file = Path(".claude/hook_debug.log")
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            _debug_file = open(log_file, "a", buffering=1)
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S,%f")[:-3]
-        with open(log_file, "a") as f:
-            f.write(f"{timestamp} {level:<5} [recover_transcript] - {message}\n")
+        _debug_file.write(f"{timestamp} {level:<5} [recover_transcript] - {message}\n")
     except Exception:
         pass
 
 
+@lru_cache(maxsize=1)
 def get_claude_dir() -> Path:
-    """Find the .claude directory."""
-    cwd = Path.cwd()
-    claude_dir = cwd / ".claude"
-    if not claude_dir.exists():
-        for parent in cwd.parents:
-            if (parent / ".claude").exists():
-                return parent / ".claude"
-        claude_dir.mkdir(parents=True, exist_ok=True)
-    return claude_dir
+    """
+    Find the .claude directory (cached).
+
+    Hooks run with CLAUDE_PROJECT_DIR set, which avoids walking up from cwd.
+    """
+    project_dir = os.environ.get("CLAUDE_PROJECT_DIR")
+    if project_dir and os.path.isdir(os.path.join(project_dir, ".claude")):
+        return Path(project_dir) / ".claude"
+
+    cwd = os.getcwd()
+    claude_dir = os.path.join(cwd, ".claude")
+    if not os.path.isdir(claude_dir):
+        child, parent = cwd, os.path.dirname(cwd)
+        while parent != child:
+            candidate = os.path.join(parent, ".claude")
+            if os.path.isdir(candidate):
+                return Path(candidate)
+            child, parent = parent, os.path.dirname(parent)
+        os.makedirs(claude_dir, exist_ok=True)
+    return Path(claude_dir)
 
 
-def compute_hash(content: str) -> str:
-    """Compute SHA-256 hash of content for deduplication."""
-    normalized = " ".join(content.lower().split())
-    return hashlib.sha256(normalized.encode()).hexdigest()[:16]
+# Last get_current_issue_local() result, keyed on the source files' mtimes
+_issue_cache: Optional[Tuple[Tuple[Optional[int], Optional[int]], Optional[int]]] = None
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    """Get a file's modification time in ns, or None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
 
 
 def get_current_issue_local() -> Optional[int]:
-    """Get current issue from local files ONLY."""
+    """
+    Get current issue from local files ONLY.
+
+    The result is cached until last_active_issue.json or ghe.local.md
+    changes (by mtime).
+    """
+    global _issue_cache
     claude_dir = get_claude_dir()
+    key = (
+        _mtime_ns(claude_dir / "last_active_issue.json"),
+        _mtime_ns(claude_dir / "ghe.local.md"),
+    )
+    if _issue_cache is not None and _issue_cache[0] == key:
+        return _issue_cache[1]
+
+    issue = _read_current_issue(claude_dir)
+    _issue_cache = (key, issue)
+    return issue
+
 
+def _read_current_issue(claude_dir: Path) -> Optional[int]:
+    """Read the current issue from last_active_issue.json or ghe.local.md."""
     # Try last_active_issue.json first
     last_active = claude_dir / "last_active_issue.json"
     if last_active.exists():
@@ -77,13 +138,13 @@ def get_current_issue_local() -> Optional[int]:
             pass
 
     # Fallback: read from ghe.local.md
-    import re
     config_file = claude_dir / "ghe.local.md"
     if config_file.exists():
         try:
-            with open(config_file) as f:
+            # Match on the raw bytes; nothing needs decoding for one setting
+            with open(config_file, 'rb') as f:
                 content = f.read()
-            match = re.search(r'^current_issue:\s*["\']?(\d+)["\']?', content, re.MULTILINE)
+            match = _ISSUE_RE.search(content)
             if match:
                 return int(match.group(1))
         except (IOError, ValueError):
@@ -111,13 +172,16 @@ def extract_messages_from_transcript(transcript_path: str) -> List[Dict[str, Any
     messages = []
 
     try:
-        with open(expanded_path, 'r') as f:
+        # Parse raw bytes: both loaders accept UTF-8 and ignore the newline
+        with open(expanded_path, 'rb') as f:
             for line in f:
-                line = line.strip()
-                if not line:
+                if len(line) < 2:
+                    continue
+                # Skip tool/system/summary lines without paying for a parse
+                if not any(marker in line for marker in _ROLE_MARKERS):
                     continue
                 try:
-                    entry = json.loads(line)
+                    entry = _json_loads(line)
                     message = entry.get("message", {})
                     if not isinstance(message, dict):
                         continue
@@ -128,14 +192,25 @@ def extract_messages_from_transcript(transcript_path: str) -> List[Dict[str, Any
 
                     # Extract text content
                     content = message.get("content", "")
-                    if isinstance(content, list):
-                        text_parts = []
-                        for block in content:
-                            if isinstance(block, dict) and block.get("type") == "text":
-                                text_parts.append(block.get("text", ""))
-                            elif isinstance(block, str):
-                                text_parts.append(block)
-                        content = "\n".join(text_parts)
+                    if type(content) is list:
+                        if len(content) == 1:
+                            # Common case: a single block needs no join
+                            block = content[0]
+                            if type(block) is dict:
+                                content = block.get("text", "") if block.get("type") == "text" else ""
+                            elif type(block) is not str:
+                                content = ""
+                            else:
+                                content = block
+                        else:
+                            text_parts = []
+                            for block in content:
+                                if type(block) is dict:
+                                    if block.get("type") == "text":
+                                        text_parts.append(block.get("text", ""))
+                                elif type(block) is str:
+                                    text_parts.append(block)
+                            content = "\n".join(text_parts)
 
                     if content:
                         messages.append({
@@ -144,7 +219,7 @@ def extract_messages_from_transcript(transcript_path: str) -> List[Dict[str, Any
                             "timestamp": entry.get("timestamp", datetime.now(timezone.utc).isoformat()),
                         })
 
-                except json.JSONDecodeError:
+                except (json.JSONDecodeError, UnicodeDecodeError):
                     continue
 
         debug_log(f"Extracted {len(messages)} messages from transcript")
@@ -164,14 +239,21 @@ def get_existing_hashes() -> set:
         return hashes
 
     try:
-        with open(wal_path, 'r') as f:
+        with open(wal_path, 'rb') as f:
             for line in f:
-                try:
-                    entry = json.loads(line.strip())
-                    if entry.get("hash"):
-                        hashes.add(entry["hash"])
-                except json.JSONDecodeError:
+                # Scan for the hash field instead of parsing the whole entry.
+                # Quotes inside string values are escaped, so the key can
+                # only match the real field (the last one wal_manager writes).
+                if not line.startswith(b'{'):
                     continue
+                for key in _WAL_HASH_KEYS:
+                    start = line.rfind(key)
+                    if start >= 0:
+                        start += len(key)
+                        end = line.find(b'"', start)
+                        if end > start:
+                            hashes.add(line[start:end].decode('utf-8', 'replace'))
+                        break
     except IOError:
         pass
 
@@ -231,36 +313,30 @@ def recover_messages() -> int:
 
     # Import WAL manager
     try:
-        from wal_manager import wal_append
+        from wal_manager import compute_hash, wal_append_many
     except ImportError as e:
         debug_log(f"Failed to import wal_manager: {e}", "ERROR")
         return 0
 
-    # Add missing messages to WAL
-    recovered = 0
+    # Collect missing messages, then add them to the WAL in one write
+    batch = []
     for msg in messages:
         content = msg["content"]
         content_hash = compute_hash(content)
 
-        # Skip if already in WAL
+        # Skip if already in WAL (or earlier in this recovery)
         if content_hash in existing_hashes:
             continue
+        existing_hashes.add(content_hash)
 
         # Determine speaker
         speaker = "claude" if msg["role"] == "assistant" else "user"
+        batch.append((speaker, issue, content, content_hash))
 
-        # Append to WAL
-        seq = wal_append(
-            speaker=speaker,
-            issue=issue,
-            content=content,
-            content_hash=content_hash
-        )
-
-        if seq > 0:
-            recovered += 1
-            existing_hashes.add(content_hash)  # Avoid duplicates within same recovery
-            debug_log(f"Recovered {speaker} message seq={seq}")
+    seqs = wal_append_many(batch)
+    recovered = len(seqs)
+    if batch and not seqs:
+        debug_log(f"Failed to append {len(batch)} messages to WAL", "ERROR")
 
     debug_log(f"Recovered {recovered} messages")
 
@@ -26,15 +26,16 @@ Functions provided:
 """
 
 import os
+import random
 import re
 import sys
-import json
 import time
 import argparse
 import subprocess
 import shutil
 from pathlib import Path
-from typing import Optional, List
+from urllib.parse import quote
+from typing import Any, Dict, Optional, List, Set
 from datetime import datetime, timezone
 
 # Import from ghe_common module
@@ -44,6 +45,7 @@ from ghe_common import (
     ghe_find_config_file,
     ghe_git,
     ghe_gh,
+    ghe_gh_graphql,
     GHE_RED as RED,
     GHE_GREEN as GREEN,
     GHE_YELLOW as YELLOW,
@@ -55,8 +57,16 @@ LOCK_TTL = int(os.environ.get("LOCK_TTL", "900"))  # 15 minutes default
 HEARTBEAT_INTERVAL = int(os.environ.get("HEARTBEAT_INTERVAL", "60"))  # 1 minute
 MAX_RETRIES = int(os.environ.get("MAX_RETRIES", "3"))
 RETRY_DELAY = int(os.environ.get("RETRY_DELAY", "2"))
+LOCK_WAIT_MAX_DELAY = 30  # Longest pause between merge lock attempts (seconds)
+LOCK_RACE_READS = 3  # Holder reads while our own lock label is not yet visible
 GHE_WORKTREES_DIR = os.environ.get("GHE_WORKTREES_DIR", "../ghe-worktrees")
 
+# Seconds a successful `gh auth status` is trusted before checking again
+GH_AUTH_TTL = 300.0
+
+# Monotonic time until which gh is known to be authenticated
+_gh_auth_ok_until: float = 0.0
+
 
 def debug_log(message: str, level: str = "INFO") -> None:
     """
@@ -100,6 +110,24 @@ def log_info(message: str) -> None:
 # =============================================================================
 
 
+def _list_worktrees() -> Optional[Set[str]]:
+    """
+    Get the resolved paths of all worktrees git knows about
+
+    Returns:
+        Set of real paths, or None if git worktree list failed
+    """
+    result = ghe_git("worktree", "list", "--porcelain", capture=True)
+    if result.returncode != 0:
+        return None
+
+    return {
+        os.path.realpath(line[9:])
+        for line in result.stdout.splitlines()
+        if line.startswith("worktree ")
+    }
+
+
 def verify_worktree_health(worktree_path: str) -> bool:
     """
     Verify worktree is healthy and usable
@@ -138,20 +166,20 @@ def verify_worktree_health(worktree_path: str) -> bool:
         return False
 
     # Check 4: Git recognizes it as worktree
-    result = ghe_git("worktree", "list", capture=True)
-    if result.returncode != 0:
+    worktrees = _list_worktrees()
+    if worktrees is None:
         log_error("Failed to list worktrees")
         return False
 
-    realpath = str(worktree_path_obj.resolve())
-    if realpath not in result.stdout:
+    realpath = os.path.realpath(worktree_path)
+    if realpath not in worktrees:
         log_warn(f"Git does not recognize worktree: {worktree_path}")
         log_info("Attempting repair with: git worktree prune")
         ghe_git("worktree", "prune")
 
         # Re-check after prune
-        result = ghe_git("worktree", "list", capture=True)
-        if result.returncode != 0 or realpath not in result.stdout:
+        worktrees = _list_worktrees()
+        if worktrees is None or realpath not in worktrees:
             log_error("Worktree still not recognized after prune")
             return False
 
@@ -187,6 +215,40 @@ def verify_worktree_health(worktree_path: str) -> bool:
     return True
 
 
+def _remove_dir_in_background(path: Path) -> bool:
+    """
+    Move a directory out of the way and delete it in a detached process
+
+    The rename is atomic and instant, so the caller does not wait for a
+    large worktree to be unlinked file by file. The trash name is hidden
+    so it never matches the issue-* worktree glob.
+
+    Args:
+        path: Directory to remove
+
+    Returns:
+        True if the directory is gone from its path, False to fall back
+        to removing it synchronously
+    """
+    trash = path.with_name(f".{path.name}.trash.{os.getpid()}.{int(time.time())}")
+    try:
+        os.rename(path, trash)
+    except OSError:
+        return False
+
+    try:
+        subprocess.Popen(
+            ["rm", "-rf", str(trash)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        shutil.rmtree(trash, ignore_errors=True)
+    return True
+
+
 def safe_worktree_cleanup(worktree_path: str, force: bool = False) -> bool:
     """
     Safely clean up a worktree, handling all edge cases
@@ -246,11 +308,12 @@ def safe_worktree_cleanup(worktree_path: str, force: bool = False) -> bool:
         ghe_git("worktree", "prune")
 
         # Remove directory
-        try:
-            shutil.rmtree(worktree_path)
-        except OSError as e:
-            log_error(f"Failed to remove directory: {e}")
-            return False
+        if not _remove_dir_in_background(worktree_path_obj):
+            try:
+                shutil.rmtree(worktree_path)
+            except OSError as e:
+                log_error(f"Failed to remove directory: {e}")
+                return False
 
         log_ok(f"Worktree force-removed: {worktree_path}")
         return True
@@ -263,6 +326,151 @@ def safe_worktree_cleanup(worktree_path: str, force: bool = False) -> bool:
 # MERGE LOCK SAFEGUARDS
 # =============================================================================
 
+# Open issues carrying the lock label, newest first (as gh issue list orders them)
+_MERGE_LOCK_QUERY = (
+    "query($owner: String!, $repo: String!, $label: String!) {"
+    " repository(owner: $owner, name: $repo) {"
+    " issues(labels: [$label], states: OPEN, first: 5,"
+    " orderBy: {field: CREATED_AT, direction: DESC}) {"
+    " totalCount nodes { number updatedAt } } } }"
+)
+
+
+def _query_merge_lock(lock_label: str) -> Optional[Dict[str, Any]]:
+    """
+    Get the open issues holding the merge lock in one request
+
+    With a token this is an ETag-revalidated REST list over the persistent
+    connection, so polling an unchanged lock costs no rate limit. Otherwise
+    it is one GraphQL query through gh.
+
+    Args:
+        lock_label: Label that marks the lock holder
+
+    Returns:
+        Issue connection with "totalCount" and "nodes" (number, updatedAt),
+        or None if the query failed
+    """
+    from ghe_api import ghe_api_available, ghe_api_get_cached, ghe_api_repo
+
+    if ghe_api_available():
+        status, items = ghe_api_get_cached(
+            f"/repos/{ghe_api_repo()}/issues"
+            f"?labels={quote(lock_label, safe='')}&state=open&per_page=100"
+        )
+        if status != 200 or not isinstance(items, list):
+            return None
+        # The REST issues list also contains pull requests
+        nodes = [
+            {"number": item["number"], "updatedAt": item["updated_at"]}
+            for item in items
+            if "pull_request" not in item
+        ]
+        return {"totalCount": len(nodes), "nodes": nodes}
+
+    data = ghe_gh_graphql(
+        _MERGE_LOCK_QUERY, {"owner": "{owner}", "repo": "{repo}", "label": lock_label}
+    )
+    return ((data or {}).get("repository") or {}).get("issues")
+
+
+# Per-holder field of the race check query: recent label events of one issue
+_LOCK_LABELED_FIELD = (
+    "i{number}: issue(number: {number}) {{"
+    " timelineItems(last: 10, itemTypes: [LABELED_EVENT]) {{"
+    " nodes {{ ... on LabeledEvent {{ createdAt label {{ name }} }} }} }} }}"
+)
+
+
+def _lock_label_times(numbers: List[int], lock_label: str) -> Optional[Dict[int, str]]:
+    """
+    Get when each lock holder last added the lock label
+
+    Args:
+        numbers: Issue numbers currently carrying the lock label
+        lock_label: Label that marks the lock holder
+
+    Returns:
+        Mapping of issue number to the second of its latest label-add
+        ("YYYY-MM-DDTHH:MM:SS"); issues without a readable event are left
+        out. None if the label events could not be read.
+    """
+    query = (
+        "query($owner: String!, $repo: String!) {"
+        " repository(owner: $owner, name: $repo) { "
+        + " ".join(_LOCK_LABELED_FIELD.format(number=number) for number in numbers)
+        + " } }"
+    )
+    data = ghe_gh_graphql(query, {"owner": "{owner}", "repo": "{repo}"})
+    repository = (data or {}).get("repository")
+    if not repository:
+        return None
+
+    labeled_at = {}
+    for number in numbers:
+        issue = repository.get(f"i{number}") or {}
+        times = [
+            event["createdAt"][:19]
+            for event in (issue.get("timelineItems") or {}).get("nodes") or []
+            if (event.get("label") or {}).get("name") == lock_label
+        ]
+        if times:
+            labeled_at[number] = max(times)
+    return labeled_at
+
+
+def _won_lock_race(issue_num: str, lock_label: str) -> bool:
+    """
+    Decide whether our freshly added lock label stands
+
+    Every racing agent applies the same rule: we keep the lock only if
+    our label-add is strictly earlier, to the second, than every other
+    holder's. GitHub timestamps have one-second resolution, so a
+    same-second tie cannot be ordered and all tied holders back off.
+
+    The holders are read right away. Only a read that does not show our
+    own label yet is stale enough to be missing a peer's too; it is
+    repeated (up to LOCK_RACE_READS times, with a short backoff) instead
+    of pausing before every check. A peer that labels after our label is
+    visible will see ours and apply the same rule.
+
+    Args:
+        issue_num: Issue number that just added the lock label
+        lock_label: Label that marks the lock holder
+
+    Returns:
+        True if we hold the lock alone or labeled first, False otherwise
+    """
+    for attempt in range(LOCK_RACE_READS):
+        lock_issues = _query_merge_lock(lock_label)
+        if lock_issues is None:
+            log_warn("Could not verify lock holders")
+            return False
+
+        numbers = [node["number"] for node in lock_issues.get("nodes") or []]
+        if (lock_issues.get("totalCount") or 0) > len(numbers):
+            log_warn("Race condition detected - multiple lock holders!")
+            return False  # Some holders are not even listed
+        if int(issue_num) in numbers:
+            break
+        if attempt < LOCK_RACE_READS - 1:
+            time.sleep(0.25 * 2**attempt)
+    else:
+        log_warn("Our lock label is not visible yet, cannot verify holders")
+        return False
+
+    others = [number for number in numbers if str(number) != issue_num]
+    if not others:
+        return True
+
+    log_warn("Race condition detected - multiple lock holders!")
+
+    labeled_at = _lock_label_times([int(issue_num)] + others, lock_label)
+    ours = (labeled_at or {}).get(int(issue_num))
+    if ours is None:
+        return False
+    return all(number in labeled_at and labeled_at[number] > ours for number in others)
+
 
 def acquire_merge_lock_safe(issue_num: str) -> bool:
     """
@@ -278,26 +486,12 @@ def acquire_merge_lock_safe(issue_num: str) -> bool:
 
     log_info(f"Attempting to acquire merge lock for issue #{issue_num}")
 
-    # Check for existing lock (using ghe_gh to run from correct repo root)
-    result = ghe_gh(
-        "issue",
-        "list",
-        "--label",
-        lock_label,
-        "--state",
-        "open",
-        "--json",
-        "number,updatedAt",
-        capture=True,
-    )
-
-    existing_lock = ""
-    if result.returncode == 0:
-        existing_lock = result.stdout.strip()
+    # Check for existing lock
+    lock_issues = _query_merge_lock(lock_label)
 
-    if existing_lock and existing_lock != "[]":
+    if lock_issues:
         try:
-            lock_data = json.loads(existing_lock)
+            lock_data = lock_issues.get("nodes") or []
             if lock_data:
                 lock_issue = str(lock_data[0]["number"])
                 lock_time = lock_data[0]["updatedAt"]
@@ -331,7 +525,7 @@ def acquire_merge_lock_safe(issue_num: str) -> bool:
                 else:
                     log_warn("Could not parse lock timestamp, assuming stale")
                     ghe_gh("issue", "edit", lock_issue, "--remove-label", lock_label)
-        except (json.JSONDecodeError, KeyError, IndexError):
+        except (KeyError, IndexError, TypeError):
             pass
 
     # Acquire lock
@@ -340,32 +534,8 @@ def acquire_merge_lock_safe(issue_num: str) -> bool:
         log_error("Failed to add merge lock label")
         return False
 
-    # Brief pause to detect race conditions
-    time.sleep(2)
-
-    # Verify we're the only lock holder (race condition check)
-    result = ghe_gh(
-        "issue",
-        "list",
-        "--label",
-        lock_label,
-        "--state",
-        "open",
-        "--json",
-        "number",
-        capture=True,
-    )
-
-    holders = 0
-    if result.returncode == 0:
-        try:
-            lock_data = json.loads(result.stdout.strip())
-            holders = len(lock_data)
-        except json.JSONDecodeError:
-            holders = 0
-
-    if holders > 1:
-        log_error("Race condition detected - multiple lock holders!")
+    # Verify we're the only lock holder, or the first (race condition check)
+    if not _won_lock_race(issue_num, lock_label):
         log_info("Releasing our lock to avoid deadlock...")
         ghe_gh("issue", "edit", issue_num, "--remove-label", lock_label)
         return False
@@ -423,6 +593,7 @@ def wait_for_merge_lock(issue_num: str, timeout: Optional[int] = None) -> bool:
 
     log_info(f"Waiting for merge lock (timeout: {timeout}s)...")
 
+    attempt = 0
     while True:
         if acquire_merge_lock_safe(issue_num):
             return True
@@ -432,8 +603,13 @@ def wait_for_merge_lock(issue_num: str, timeout: Optional[int] = None) -> bool:
             log_error(f"Timeout waiting for merge lock ({elapsed}s > {timeout}s)")
             return False
 
-        log_info(f"Lock busy, waiting... ({elapsed}s / {timeout}s)")
-        time.sleep(30)
+        # Exponential backoff (1s, 2s, 4s, ... up to LOCK_WAIT_MAX_DELAY) with
+        # +/-25% jitter so waiting agents do not poll in lockstep
+        delay = min(LOCK_WAIT_MAX_DELAY, 2**attempt) * random.uniform(0.75, 1.25)
+        attempt += 1
+
+        log_info(f"Lock busy, retrying in {delay:.1f}s... ({elapsed}s / {timeout}s)")
+        time.sleep(delay)
 
 
 # =============================================================================
@@ -640,6 +816,28 @@ def validate_with_retry(script: str, file: str) -> bool:
 # =============================================================================
 
 
+def _gh_auth_ok() -> bool:
+    """
+    Check that the GitHub CLI is authenticated
+
+    A success is remembered for GH_AUTH_TTL seconds, so repeated pre-flight
+    checks do not run gh auth status each time. Failures are not cached.
+
+    Returns:
+        True if gh is authenticated
+    """
+    global _gh_auth_ok_until
+
+    if time.monotonic() < _gh_auth_ok_until:
+        return True
+
+    result = subprocess.run(["gh", "auth", "status"], capture_output=True, check=False)
+    if result.returncode != 0:
+        return False
+    _gh_auth_ok_until = time.monotonic() + GH_AUTH_TTL
+    return True
+
+
 def pre_flight_check(issue_num: str) -> bool:
     """
     Run all safety checks before starting work on an issue
@@ -744,8 +942,7 @@ def pre_flight_check(issue_num: str) -> bool:
 
     # Check 6: GitHub CLI authenticated
     print("[6/6] GitHub auth: ", end="")
-    result = subprocess.run(["gh", "auth", "status"], capture_output=True, check=False)
-    if result.returncode == 0:
+    if _gh_auth_ok():
         print(f"{GREEN}OK{NC}")
     else:
         print(f"{RED}NOT AUTHENTICATED{NC}")
@@ -27,6 +27,7 @@ import sys
 import subprocess
 from pathlib import Path
 from datetime import datetime
+from typing import List, Optional
 from zoneinfo import ZoneInfo
 
 # Import from ghe_common
@@ -440,18 +441,26 @@ Save report to: GHE_REPORTS/{timestamp}_issue_{issue_num}_{agent_name}_({greek_n
     return prompt
 
 
-def main() -> None:
-    """Main entry point for spawn_agent.py"""
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main entry point for spawn_agent.py
+
+    Args:
+        argv: Arguments (agent-name, issue-number, context); defaults to
+            sys.argv[1:]. Lets other scripts spawn agents in-process.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
     debug_log("main() entry")
-    debug_log(f"sys.argv={sys.argv}")
+    debug_log(f"argv={argv}")
     # Parse arguments
-    if len(sys.argv) < 2:
+    if len(argv) < 1:
         show_usage()
         sys.exit(1)
 
-    agent_name = sys.argv[1]
-    issue_num = sys.argv[2] if len(sys.argv) > 2 else ""
-    context = sys.argv[3] if len(sys.argv) > 3 else ""
+    agent_name = argv[0]
+    issue_num = argv[1] if len(argv) > 1 else ""
+    context = argv[2] if len(argv) > 2 else ""
     debug_log(
         f"Parsed args: agent_name={agent_name}, issue_num={issue_num}, context={context[:50] if context else ''}"
     )
@@ -23,23 +23,35 @@ import hashlib
 import json
 import os
 import sys
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 
+@lru_cache(maxsize=1)
 def get_claude_dir() -> Path:
-    """Find or create the .claude directory."""
-    cwd = Path.cwd()
-    claude_dir = cwd / ".claude"
-
-    if not claude_dir.exists():
-        for parent in cwd.parents:
-            if (parent / ".claude").exists():
-                return parent / ".claude"
-        claude_dir.mkdir(parents=True, exist_ok=True)
+    """
+    Find or create the .claude directory (cached).
 
-    return claude_dir
+    Hooks run with CLAUDE_PROJECT_DIR set, which avoids walking up from cwd.
+    """
+    project_dir = os.environ.get("CLAUDE_PROJECT_DIR")
+    if project_dir and os.path.isdir(os.path.join(project_dir, ".claude")):
+        return Path(project_dir) / ".claude"
+
+    cwd = os.getcwd()
+    claude_dir = os.path.join(cwd, ".claude")
+    if not os.path.isdir(claude_dir):
+        child, parent = cwd, os.path.dirname(cwd)
+        while parent != child:
+            candidate = os.path.join(parent, ".claude")
+            if os.path.isdir(candidate):
+                return Path(candidate)
+            child, parent = parent, os.path.dirname(parent)
+        os.makedirs(claude_dir, exist_ok=True)
+    return Path(claude_dir)
 
 
 def get_wal_path() -> Path:
@@ -85,45 +97,69 @@ def release_wal_lock(lock_file) -> None:
         pass
 
 
-def get_next_sequence() -> int:
-    """Get and increment the sequence number atomically."""
+@contextmanager
+def _wal_lock() -> Iterator[bool]:
+    """
+    Hold the WAL lock for the duration of the block.
+
+    Retries a non-blocking lock for up to 2 seconds and yields whether it
+    was acquired; callers fall back on their own when it was not.
+    """
     import time
-    seq_path = get_sequence_path()
     lock_path = get_lock_path()
 
     lock_path.parent.mkdir(parents=True, exist_ok=True)
 
     with open(lock_path, 'w') as lock_file:
-        # Non-blocking lock with retry (max 2 seconds)
         for attempt in range(20):
-            try:
-                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            if acquire_wal_lock(lock_file):
                 break
-            except (IOError, OSError):
-                if attempt < 19:
-                    time.sleep(0.1)
-                else:
-                    # Fallback: use timestamp-based sequence
-                    return int(time.time() * 1000) % 1000000
+            if attempt < 19:
+                time.sleep(0.1)
+        else:
+            yield False
+            return
         try:
-            if seq_path.exists():
-                try:
-                    with open(seq_path, 'r') as f:
-                        data = json.load(f)
-                        next_seq = data.get('next_seq', 1)
-                except (json.JSONDecodeError, IOError):
-                    next_seq = 1
-            else:
-                next_seq = 1
-
-            with open(seq_path, 'w') as f:
-                json.dump({'next_seq': next_seq + 1}, f)
-                f.flush()
-                os.fsync(f.fileno())
-
-            return next_seq
+            yield True
         finally:
-            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            release_wal_lock(lock_file)
+
+
+def get_next_sequence() -> int:
+    """Get and increment the sequence number atomically."""
+    import time
+    with _wal_lock() as locked:
+        if not locked:
+            # Fallback: use timestamp-based sequence
+            return int(time.time() * 1000) % 1000000
+        return _reserve_sequences(1)
+
+
+def _reserve_sequences(count: int) -> int:
+    """
+    Reserve count consecutive sequence numbers and return the first.
+
+    The caller must hold the WAL lock. flock() locks are per open file,
+    so calling get_next_sequence() while holding it would block on our
+    own lock until the timestamp fallback kicks in.
+    """
+    seq_path = get_sequence_path()
+    if seq_path.exists():
+        try:
+            with open(seq_path, 'r') as f:
+                data = json.load(f)
+                next_seq = data.get('next_seq', 1)
+        except (json.JSONDecodeError, IOError):
+            next_seq = 1
+    else:
+        next_seq = 1
+
+    with open(seq_path, 'w') as f:
+        json.dump({'next_seq': next_seq + count}, f)
+        f.flush()
+        os.fsync(f.fileno())
+
+    return next_seq
 
 
 def wal_append(
@@ -144,29 +180,64 @@ def wal_append(
     Returns:
         The sequence number of the appended entry
     """
-    import time
     wal_path = get_wal_path()
-    lock_path = get_lock_path()
 
-    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with _wal_lock() as locked:
+        if not locked:
+            return -1  # Failed to acquire lock
 
-    with open(lock_path, 'w') as lock_file:
-        # Non-blocking lock with retry (max 2 seconds)
-        for attempt in range(20):
-            try:
-                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-                break
-            except (IOError, OSError):
-                if attempt < 19:
-                    time.sleep(0.1)
-                else:
-                    return -1  # Failed to acquire lock
-        try:
-            seq = get_next_sequence()
+        seq = _reserve_sequences(1)
+
+        entry = {
+            'seq': seq,
+            'ts': datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+            'speaker': speaker,
+            'issue': issue,
+            'content': content,
+            'posted': False,
+            'comment_id': None,
+            'hash': content_hash or compute_hash(content)
+        }
+
+        with open(wal_path, 'a') as f:
+            f.write(json.dumps(entry) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+        return seq
+
+
+def wal_append_many(
+    entries: List[Tuple[str, int, str, Optional[str]]]
+) -> List[int]:
+    """
+    Append several entries to the WAL with one locked write and one fsync.
 
+    Args:
+        entries: (speaker, issue, content, content_hash) tuples, in order;
+            content_hash may be None to compute it
+
+    Returns:
+        The sequence numbers of the appended entries, in the same order
+        (empty if the lock could not be acquired)
+    """
+    if not entries:
+        return []
+
+    wal_path = get_wal_path()
+
+    with _wal_lock() as locked:
+        if not locked:
+            return []  # Failed to acquire lock
+
+        first_seq = _reserve_sequences(len(entries))
+        ts = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+
+        lines = []
+        for offset, (speaker, issue, content, content_hash) in enumerate(entries):
             entry = {
-                'seq': seq,
-                'ts': datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+                'seq': first_seq + offset,
+                'ts': ts,
                 'speaker': speaker,
                 'issue': issue,
                 'content': content,
@@ -174,15 +245,14 @@ def wal_append(
                 'comment_id': None,
                 'hash': content_hash or compute_hash(content)
             }
+            lines.append(json.dumps(entry) + '\n')
 
-            with open(wal_path, 'a') as f:
-                f.write(json.dumps(entry) + '\n')
-                f.flush()
-                os.fsync(f.fileno())
+        with open(wal_path, 'a') as f:
+            f.write(''.join(lines))
+            f.flush()
+            os.fsync(f.fileno())
 
-            return seq
-        finally:
-            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        return list(range(first_seq, first_seq + len(entries)))
 
 
 def wal_read_all() -> List[Dict[str, Any]]:
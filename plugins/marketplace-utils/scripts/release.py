@@ -29,7 +29,10 @@ Requirements:
 
 import argparse
 import json
+import os
 import re
+import shlex
+import shutil
 import subprocess
 import sys
 from datetime import datetime
@@ -40,6 +43,14 @@ from typing import Dict, List, Optional
 __version__ = "1.1.6"
 SCRIPT_NAME = "release.py"
 
+# Version string: base version plus optional suffix (e.g. 0.6.1-alpha)
+VERSION_RE = re.compile(r'^(\d+\.\d+\.\d+)(-.*)?$')
+# Shields.io version badge and release tag link in the marketplace README
+BADGE_VERSION_RE = re.compile(r'(version-)\d+\.\d+\.\d+(?:--[a-zA-Z0-9]+)?(-blue)')
+RELEASE_TAG_RE = re.compile(r'(releases/tag/)[\w-]+-v\d+\.\d+\.\d+(?:-[a-zA-Z0-9]+)?')
+# Value of a "version" field in a JSON manifest
+JSON_VERSION_RE = re.compile(rb'("version"\s*:\s*")[^"]*(")')
+
 
 class Colors:
     """ANSI color codes for terminal output."""
@@ -79,11 +90,15 @@ def print_version() -> None:
     print()
 
 
-def run_cmd(cmd: str, check: bool = True, capture: bool = False) -> subprocess.CompletedProcess:
-    """Run a shell command."""
-    result = subprocess.run(cmd, shell=True, capture_output=capture, text=True)
+def run_cmd(cmd: List[str], check: bool = True, capture: bool = False,
+            cwd: Optional[Path] = None) -> subprocess.CompletedProcess:
+    """Run a command from an argv list (no shell)."""
+    try:
+        result = subprocess.run(cmd, capture_output=capture, text=True, cwd=cwd)
+    except FileNotFoundError:
+        result = subprocess.CompletedProcess(cmd, 127, '', f"{cmd[0]}: command not found")
     if check and result.returncode != 0:
-        error(f"Command failed: {cmd}\n{result.stderr if capture else ''}")
+        error(f"Command failed: {shlex.join(cmd)}\n{result.stderr if capture else ''}")
     return result
 
 
@@ -171,20 +186,69 @@ class MarketplaceConfig:
 
 def get_repo_url() -> str:
     """Get the GitHub repository URL dynamically."""
-    result = run_cmd("gh repo view --json nameWithOwner --jq '.nameWithOwner'", capture=True)
+    result = run_cmd(['gh', 'repo', 'view', '--json', 'nameWithOwner', '--jq', '.nameWithOwner'],
+                     capture=True)
     repo_name = result.stdout.strip()
     return f"https://github.com/{repo_name}"
 
 
+def read_version_tags(prefix: str) -> Optional[List[str]]:
+    """
+    Read tags named <prefix><version> straight from .git, newest first.
+
+    Loose refs under refs/tags and packed-refs are both read, so no git
+    process is started. Returns None when the refs cannot be read this way
+    (no .git directory, e.g. in a worktree) or a matching tag is not a
+    plain version; callers then ask git instead.
+    """
+    git_dir = Path('.git')
+    if not git_dir.is_dir():
+        return None
+
+    names = set()
+    try:
+        tags_dir = git_dir / 'refs' / 'tags'
+        if tags_dir.is_dir():
+            names.update(os.listdir(tags_dir))
+        packed_refs = git_dir / 'packed-refs'
+        if packed_refs.exists():
+            with open(packed_refs) as f:
+                for line in f:
+                    ref = line.rstrip('\n').partition(' ')[2]
+                    if ref.startswith('refs/tags/'):
+                        names.add(ref[10:])
+    except OSError:
+        return None
+
+    versions = []
+    for name in names:
+        if not name.startswith(prefix):
+            continue
+        match = VERSION_RE.match(name[len(prefix):])
+        if not match:
+            return None
+        base = tuple(int(part) for part in match.group(1).split('.'))
+        versions.append(((base, match.group(2) or ''), name))
+
+    # Same order as git tag --sort=-v:refname (a suffixed version after its base)
+    return [name for _, name in sorted(versions, reverse=True)]
+
+
 def get_previous_tag(plugin_name: str) -> str:
     """Get the previous git tag for this plugin."""
     # Look for tags matching this plugin pattern
-    result = run_cmd(f"git tag -l '{plugin_name}-v*' --sort=-v:refname | head -1", capture=True, check=False)
-    if result.stdout.strip():
-        return result.stdout.strip()
+    tags = read_version_tags(f'{plugin_name}-v')
+    if tags is None:
+        result = run_cmd(['git', 'tag', '-l', f'{plugin_name}-v*', '--sort=-v:refname'],
+                         capture=True, check=False)
+        tags = result.stdout.split()
+    if tags:
+        return tags[0]
     # Fall back to any previous tag
-    result = run_cmd("git describe --tags --abbrev=0 HEAD^ 2>/dev/null || echo 'v0.0.0'", capture=True)
-    return result.stdout.strip()
+    result = run_cmd(['git', 'describe', '--tags', '--abbrev=0', 'HEAD^'], capture=True, check=False)
+    if result.returncode == 0 and result.stdout.strip():
+        return result.stdout.strip()
+    return 'v0.0.0'
 
 
 def check_prerequisites() -> None:
@@ -192,19 +256,18 @@ def check_prerequisites() -> None:
     info("Checking prerequisites...")
 
     for cmd in ['gh', 'git']:
-        result = run_cmd(f"command -v {cmd}", check=False, capture=True)
-        if result.returncode != 0:
+        if shutil.which(cmd) is None:
             error(f"{cmd} is not installed")
 
-    result = run_cmd("gh auth status", check=False, capture=True)
+    result = run_cmd(['gh', 'auth', 'status'], check=False, capture=True)
     if result.returncode != 0:
         error("Not authenticated with GitHub CLI. Run 'gh auth login'")
 
-    result = run_cmd("git rev-parse --git-dir", check=False, capture=True)
+    result = run_cmd(['git', 'rev-parse', '--git-dir'], check=False, capture=True)
     if result.returncode != 0:
         error("Not in a git repository")
 
-    result = run_cmd("git status --porcelain", capture=True)
+    result = run_cmd(['git', 'status', '--porcelain'], capture=True)
     if result.stdout.strip():
         warn("You have uncommitted changes. They will be included in this release.")
         response = input("Continue? [y/N] ").strip().lower()
@@ -229,12 +292,12 @@ def validate_plugin(config: MarketplaceConfig, plugin_name: str) -> None:
     if not validator_script.exists():
         # Fallback to basic validation if comprehensive validator not found
         warn("plugin_validator.py not found, falling back to basic validation")
-        result = run_cmd(f"claude plugin validate \"{plugin_path}\"", check=False, capture=True)
+        result = run_cmd(['claude', 'plugin', 'validate', str(plugin_path)], check=False, capture=True)
         if result.returncode != 0:
             error(f"Plugin validation failed:\n{result.stdout}\n{result.stderr}")
     else:
         # Use comprehensive validator
-        result = run_cmd(f"python3 \"{validator_script}\" \"{plugin_path}\"", check=False, capture=True)
+        result = run_cmd(['python3', str(validator_script), str(plugin_path)], check=False, capture=True)
         if result.returncode != 0:
             error(f"Plugin validation failed:\n{result.stdout}\n{result.stderr}")
 
@@ -243,7 +306,7 @@ def validate_plugin(config: MarketplaceConfig, plugin_name: str) -> None:
 
 def parse_version(version: str) -> tuple:
     """Parse version string into (base_version, suffix)."""
-    match = re.match(r'^(\d+\.\d+\.\d+)(-.*)?$', version)
+    match = VERSION_RE.match(version)
     if match:
         return match.group(1), match.group(2) or ''
     return '0.0.0', ''
@@ -274,9 +337,42 @@ def bump_version(current: str, bump_type: str) -> str:
     return f"{major}.{minor}.{patch}"
 
 
+def write_json_version(path: Path, data: Dict, new_version: str, anchor: Optional[re.Pattern] = None) -> None:
+    """
+    Write a JSON manifest whose only change is one "version" value.
+
+    The first "version" field after the anchor pattern (or the start of the
+    file) is patched in place, so the file keeps its exact layout. If the
+    patched file does not parse to the expected data, it is re-serialized.
+    The file is replaced atomically either way.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+
+    start = 0
+    if anchor is not None:
+        match = re.search(anchor, raw)
+        start = match.end() if match else len(raw)
+    patched = raw[:start] + JSON_VERSION_RE.sub(
+        lambda m: m.group(1) + new_version.encode() + m.group(2), raw[start:], count=1
+    )
+
+    try:
+        patched_ok = json.loads(patched) == data
+    except ValueError:
+        patched_ok = False
+    if not patched_ok:
+        patched = (json.dumps(data, indent=2) + '\n').encode()
+
+    tmp_path = path.with_name(f'.{path.name}.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(patched)
+    os.replace(tmp_path, path)
+
+
 def update_marketplace_json_for_plugin(config: MarketplaceConfig, plugin_name: str, new_version: str) -> None:
     """Update version for a specific plugin in marketplace.json."""
-    data = config.marketplace_data.copy()
+    data = config.marketplace_data
 
     # Find and update the specific plugin
     plugin_index = config.get_plugin_index(plugin_name)
@@ -286,9 +382,9 @@ def update_marketplace_json_for_plugin(config: MarketplaceConfig, plugin_name: s
     old_version = data['plugins'][plugin_index].get('version', 'unknown')
     data['plugins'][plugin_index]['version'] = new_version
 
-    with open(config.marketplace_json_path, 'w') as f:
-        json.dump(data, f, indent=2)
-        f.write('\n')
+    # The plugin's entry starts at its name inside the plugins array
+    anchor = rb'"plugins"\s*:\s*\[.*?"name"\s*:\s*' + re.escape(json.dumps(plugin_name).encode())
+    write_json_version(config.marketplace_json_path, data, new_version, re.compile(anchor, re.DOTALL))
 
     success(f"{config.marketplace_json_path}")
     print(f"       plugins[{plugin_name}].version: {old_version} -> {new_version}")
@@ -308,9 +404,7 @@ def update_plugin_json(config: MarketplaceConfig, plugin_name: str, new_version:
     old_version = data.get('version', 'unknown')
     data['version'] = new_version
 
-    with open(plugin_json_path, 'w') as f:
-        json.dump(data, f, indent=2)
-        f.write('\n')
+    write_json_version(plugin_json_path, data, new_version)
 
     success(f"{plugin_json_path}")
     print(f"       version: {old_version} -> {new_version}")
@@ -358,18 +452,21 @@ def update_readme_for_plugin(config: MarketplaceConfig, plugin_name: str, old_ve
     old_suffix_escaped = old_suffix.replace('-', '--')
     new_suffix_escaped = new_suffix.replace('-', '--')
 
-    replacements = [
+    replacements: Dict[str, str] = {}
+    for old, new in (
         # Shields.io badges with suffix
         (f'version-{old_base}{old_suffix_escaped}-blue', f'version-{new_base}{new_suffix_escaped}-blue'),
         # Shields.io badges without suffix
         (f'version-{old_base}-blue', f'version-{new_base}-blue'),
-        # Version strings
-        (f'v{old_version}', f'v{new_version}'),
+        # Version strings (also covers the v-prefixed form)
         (old_version, new_version),
-    ]
+    ):
+        replacements.setdefault(old, new)
 
-    for old, new in replacements:
-        content = content.replace(old, new)
+    # One pass over the README; earlier alternatives win at the same position,
+    # and replaced text is never matched again
+    pattern = re.compile('|'.join(map(re.escape, replacements)))
+    content = pattern.sub(lambda m: replacements[m.group(0)], content)
 
     with open(readme_path, 'w') as f:
         f.write(content)
@@ -450,14 +547,12 @@ def update_marketplace_readme(config: MarketplaceConfig) -> None:
         suffix_escaped = suffix.replace('-', '--') if suffix else ''
 
         # Update version badge - handles both with and without suffix
-        badge_pattern = r'(version-)\d+\.\d+\.\d+(?:--[a-zA-Z0-9]+)?(-blue)'
         new_badge = f'\\g<1>{base}{suffix_escaped}\\g<2>'
-        content = re.sub(badge_pattern, new_badge, content)
+        content = BADGE_VERSION_RE.sub(new_badge, content)
 
         # Update release tag links
-        old_tag_pattern = r'(releases/tag/)[\w-]+-v\d+\.\d+\.\d+(?:-[a-zA-Z0-9]+)?'
         new_tag = f'\\g<1>{main_name}-v{main_version}'
-        content = re.sub(old_tag_pattern, new_tag, content)
+        content = RELEASE_TAG_RE.sub(new_tag, content)
 
         # Update section headers with version (e.g., "### GHE v0.5.8" -> "### GHE v0.5.9")
         # Match plugin name (case-insensitive) followed by version
@@ -480,19 +575,19 @@ def update_marketplace_readme(config: MarketplaceConfig) -> None:
 
 def create_commit(plugin_name: str, new_version: str, notes: str) -> None:
     """Create git commit with all changes."""
-    run_cmd("git add -A")
+    run_cmd(['git', 'add', '-A'])
     tag = f"{plugin_name}-v{new_version}"
     commit_msg = f"Release {tag}: {notes}"
-    run_cmd(f'git commit -m "{commit_msg}"')
+    run_cmd(['git', 'commit', '-m', commit_msg])
     success("Created commit")
 
 
 def create_tag(plugin_name: str, new_version: str, notes: str) -> None:
     """Create and push git tag."""
     tag = f"{plugin_name}-v{new_version}"
-    run_cmd(f'git tag -a "{tag}" -m "{tag}: {notes}"')
-    run_cmd("git push origin main")
-    run_cmd(f'git push origin "{tag}"')
+    run_cmd(['git', 'tag', '-a', tag, '-m', f"{tag}: {notes}"])
+    run_cmd(['git', 'push', 'origin', 'main'])
+    run_cmd(['git', 'push', 'origin', tag])
     success(f"Created and pushed tag {tag}")
 
 
@@ -524,7 +619,8 @@ def create_release(config: MarketplaceConfig, plugin_name: str, new_version: str
 
     try:
         plugin_upper = plugin_name.upper()
-        run_cmd(f'gh release create "{tag}" --title "{plugin_upper} v{new_version}" --notes-file "{temp_file}"')
+        run_cmd(['gh', 'release', 'create', tag, '--title', f"{plugin_upper} v{new_version}",
+                 '--notes-file', temp_file])
         success("Created GitHub release")
     finally:
         Path(temp_file).unlink(missing_ok=True)
@@ -570,8 +666,11 @@ def clear_local_plugin_cache(config: MarketplaceConfig, plugin_name: str) -> Non
     if marketplace_path.exists() and (marketplace_path / ".git").exists():
         info("Updating marketplace cache from GitHub...")
         try:
-            result = run_cmd(f'cd "{marketplace_path}" && git fetch origin && git reset --hard origin/main',
-                           check=False, capture=True)
+            result = run_cmd(['git', 'fetch', 'origin'], check=False, capture=True,
+                             cwd=marketplace_path)
+            if result.returncode == 0:
+                result = run_cmd(['git', 'reset', '--hard', 'origin/main'], check=False,
+                                 capture=True, cwd=marketplace_path)
             if result.returncode == 0:
                 success("Marketplace cache updated")
                 # Clear Python bytecode cache (__pycache__) to prevent stale .pyc files
@@ -585,8 +684,8 @@ def clear_local_plugin_cache(config: MarketplaceConfig, plugin_name: str) -> Non
                 if pycache_count > 0:
                     success(f"Cleared {pycache_count} __pycache__ directories")
                 # Get the new commit SHA
-                sha_result = run_cmd(f'cd "{marketplace_path}" && git rev-parse HEAD',
-                                   check=False, capture=True)
+                sha_result = run_cmd(['git', 'rev-parse', 'HEAD'], check=False, capture=True,
+                                     cwd=marketplace_path)
                 if sha_result.returncode == 0:
                     new_commit_sha = sha_result.stdout.strip()
             else: